@@ -7,17 +7,30 @@ Generates interconnected CSV files with realistic business rules for analytics u
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
+import io
+import json
 import math
+import os
+import platform
 import random
-from dataclasses import dataclass
+import shutil
+import sqlite3
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
 from datetime import date, timedelta
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, List, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 from faker import Faker
-from tqdm import tqdm
 
 
 # -----------------------------
@@ -25,9 +38,16 @@ from tqdm import tqdm
 # -----------------------------
 
 DEFAULT_OUTPUT_DIR = Path("data") / "synthetic"
+DEFAULT_SCHEMA_FILE = Path("database") / "schema.sql"
+SQLITE_DATABASE_NAME = "ecommerce.db"
+DAILY_PARTITION_DIR = "daily"
+CHANGE_LOG_NAME = "changes.jsonl"
 RANDOM_SEED = 20241113
 
 
+ITEMS_PER_ORDER_OPTIONS = [1, 2, 3, 4, 5]
+ITEMS_PER_ORDER_WEIGHTS = [0.10, 0.35, 0.30, 0.15, 0.10]
+
 @dataclass(frozen=True)
 class GenerationConfig:
     """Container for high-level generation targets."""
@@ -38,6 +58,33 @@ class GenerationConfig:
     order_items: int = 8_000
     reviews: int = 2_500
 
+    def __post_init__(self) -> None:
+        for name, value in vars(self).items():
+            if value < 0:
+                raise ValueError(f"{name} must be non-negative, got {value:,}")
+        if self.orders and (self.products < 1 or self.customers < 1):
+            raise ValueError("Orders need at least one product and one customer")
+        min_items, max_items = ITEMS_PER_ORDER_OPTIONS[0], ITEMS_PER_ORDER_OPTIONS[-1]
+        if not min_items * self.orders <= self.order_items <= max_items * self.orders:
+            raise ValueError(
+                f"order_items ({self.order_items:,}) must be {min_items}-{max_items}x orders ({self.orders:,})"
+            )
+        if self.reviews > self.order_items:
+            raise ValueError(f"reviews ({self.reviews:,}) cannot exceed order_items ({self.order_items:,})")
+
+    @classmethod
+    def scaled(cls, scale_factor: float, **overrides: int) -> "GenerationConfig":
+        """
+        TPC-style sizing: SF1 is the default dataset and every table grows linearly with the
+        scale factor. Explicit per-table overrides win over the scaled counts.
+        """
+        if scale_factor <= 0:
+            raise ValueError(f"scale_factor must be positive, got {scale_factor}")
+        base = cls()
+        counts = {name: max(1, round(value * scale_factor)) for name, value in vars(base).items()}
+        counts.update({name: value for name, value in overrides.items() if value is not None})
+        return cls(**counts)
+
 
 CONFIG = GenerationConfig()
 
@@ -65,6 +112,12 @@ CATEGORY_DEFINITION: Dict[str, Tuple[Sequence[str], Tuple[float, float]]] = {
         (8.0, 120.0),
     ),
 }
+CATEGORY_WEIGHTS = [0.30, 0.25, 0.20, 0.15, 0.10]
+
+QUANTITY_OPTIONS = [1, 2, 3, 4, 5]
+QUANTITY_WEIGHTS = [0.45, 0.30, 0.15, 0.07, 0.03]
+WHALe_QUANTITY_BUMP_OPTIONS = [0, 1]
+WHALe_QUANTITY_BUMP_WEIGHTS = [0.7, 0.3]
 
 DISCOUNT_OPTIONS = [0.0, 0.10, 0.20, 0.25]
 DISCOUNT_WEIGHTS = [0.70, 0.20, 0.08, 0.02]
@@ -95,8 +148,192 @@ SEASONAL_MONTH_WEIGHTS = {
     12: 1.65,
 }
 
+EMAIL_DOMAINS = ["example.com", "retailmail.com", "shopmail.com", "gmail.com", "outlook.com"]
+
+# Faker field -> generator; pooled mode pre-builds a fixed number of values per field
+FAKER_FIELDS: Dict[str, Callable[[Faker], str]] = {
+    "first_name": lambda faker: faker.first_name(),
+    "last_name": lambda faker: faker.last_name(),
+    "street_address": lambda faker: faker.street_address(),
+    "city": lambda faker: faker.city(),
+    "state_abbr": lambda faker: faker.state_abbr(),
+    "zipcode": lambda faker: faker.zipcode(),
+    "phone": lambda faker: faker.numerify("###-###-####"),
+    "catch_phrase": lambda faker: faker.catch_phrase(),
+    "company": lambda faker: faker.company(),
+}
+
+FakerPools = Dict[str, np.ndarray]
+# Upper bound on the Faker addresses drawn per batch for alternate shipping locations without --faker-pool-size
+SHIPPING_ADDRESS_POOL_SIZE = 2_000
+
+RATING_VALUES = np.array([5, 4, 3, 2, 1])
+
+POSITIVE_REVIEW_TEMPLATES: Dict[str, List[str]] = {
+    "Electronics": [
+        "Performance exceeded expectations with seamless setup.",
+        "Battery life and build quality are top-notch.",
+    ],
+    "Clothing": [
+        "Fits perfectly and fabric feels premium.",
+        "Stylish and comfortable for everyday wear.",
+    ],
+    "Home & Garden": [
+        "Quality craftsmanship and easy assembly.",
+        "Adds instant charm to the space.",
+    ],
+    "Sports": [
+        "Great durability during intense workouts.",
+        "Lightweight and enhances performance.",
+    ],
+    "Books": [
+        "Engaging read with well-developed characters.",
+        "Extremely informative and well structured.",
+    ],
+}
+NEUTRAL_REVIEW_TEMPLATES = [
+    "Overall solid value though a few minor quirks.",
+    "Meets expectations but could use refinements.",
+]
+NEGATIVE_REVIEW_TEMPLATES = [
+    "Item quality did not match the description.",
+    "Had issues shortly after purchase; disappointed.",
+]
+
+# Output format -> supported compression codecs (first is the default)
+OUTPUT_COMPRESSIONS: Dict[str, List[str]] = {
+    "csv": ["none", "gzip", "zstd"],
+    "parquet": ["zstd", "snappy", "gzip", "lz4", "brotli", "none"],
+    "arrow": ["zstd", "lz4", "none"],
+    "sqlite": ["none"],
+}
+# Low-cardinality text columns stored dictionary-encoded in Parquet/Arrow output
+DICTIONARY_COLUMNS = {
+    "category",
+    "subcategory",
+    "status",
+    "payment_method",
+    "state",
+    "country",
+    "shipping_state",
+    "shipping_country",
+}
+# Date columns stored as ISO strings in SQLite, matching the ETL
+DATE_COLUMNS = {"created_date", "registration_date", "order_date", "review_date"}
+# Text columns held as pandas categoricals in memory; those without a fixed vocabulary here
+# infer their categories from the generated values
+CATEGORICAL_COLUMNS = DICTIONARY_COLUMNS | {
+    "first_name",
+    "last_name",
+    "city",
+    "zip",
+    "shipping_address",
+    "shipping_city",
+    "shipping_zip",
+    "review_text",
+}
+CATEGORY_VOCABULARIES: Dict[str, List[str]] = {
+    "category": list(CATEGORY_DEFINITION),
+    "subcategory": list(
+        dict.fromkeys(subcategory for subcategories, _ in CATEGORY_DEFINITION.values() for subcategory in subcategories)
+    ),
+    "status": ORDER_STATUS_OPTIONS,
+    "payment_method": PAYMENT_METHOD_OPTIONS,
+    "country": ["USA"],
+    "shipping_country": ["USA"],
+    "review_text": list(
+        dict.fromkeys(
+            [
+                *(text for templates in POSITIVE_REVIEW_TEMPLATES.values() for text in templates),
+                *NEUTRAL_REVIEW_TEMPLATES,
+                *NEGATIVE_REVIEW_TEMPLATES,
+            ]
+        )
+    ),
+}
+# Integer columns held as int32 in memory and in Parquet/Arrow output
+INT32_COLUMNS = {
+    "product_id",
+    "customer_id",
+    "order_id",
+    "order_item_id",
+    "review_id",
+    "stock_quantity",
+    "quantity",
+    "rating",
+}
+# Columns that look numeric in CSV but must be read back as text (leading zeros)
+CSV_TEXT_COLUMNS = {"zip": str, "shipping_zip": str, "phone": str}
+CSV_COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+DEFAULT_ROW_GROUP_SIZE = 250_000
+
+VALIDATION_MODES = ["full", "sample", "off"]
+DEFAULT_VALIDATION_SAMPLE_SIZE = 100_000
+VALIDATION_CONFIDENCE_Z = 3.29  # two-sided 99.9%, so sampled checks rarely fail on noise alone
+MIN_SHAPE_CHECK_ROWS = 1_000  # below this many orders (or order items) the revenue-shape statistics are noise
+
+ORDER_START_DATE = date(2023, 1, 1)
 ORDER_END_DATE = date(2024, 12, 31)
 
+MANIFEST_NAME = "manifest.json"
+RUN_REPORT_NAME = "run_report.json"
+DEFAULT_CACHE_MAX_MB = 4_096
+
+
+@dataclass(frozen=True)
+class SkewProfile:
+    """
+    Data-shape overrides for stress datasets. The defaults reproduce the regular dataset:
+    category/price product weights, whale-biased customers and seasonal order dates.
+    """
+
+    name: str = "default"
+    product_zipf: Optional[float] = None  # Zipf exponent over a random product ranking; 0 = uniform
+    whale_order_weight: float = WHALe_ORDER_WEIGHT
+    hot_customer_share: float = 0.0  # fraction of customers in the hot set
+    hot_customer_order_share: float = 0.0  # fraction of all orders placed by the hot set
+    seasonal: bool = True
+    flash_sale_days: Tuple[date, ...] = ()
+    flash_sale_multiplier: float = 1.0  # order volume on a flash-sale day relative to a normal day
+
+    def __post_init__(self) -> None:
+        if self.product_zipf is not None and self.product_zipf < 0:
+            raise ValueError(f"Zipf exponent must be non-negative, got {self.product_zipf}")
+        if self.whale_order_weight <= 0:
+            raise ValueError(f"whale_order_weight must be positive, got {self.whale_order_weight}")
+        if not 0 <= self.hot_customer_share < 1 or not 0 <= self.hot_customer_order_share < 1:
+            raise ValueError("Hot customer shares must be in [0, 1)")
+        if self.flash_sale_multiplier < 1:
+            raise ValueError(f"flash_sale_multiplier must be at least 1, got {self.flash_sale_multiplier}")
+
+    @property
+    def keeps_customer_shape(self) -> bool:
+        """Whale revenue concentration only holds while the customer mix is the default one."""
+        return self.whale_order_weight == WHALe_ORDER_WEIGHT and self.hot_customer_share == 0
+
+    @property
+    def keeps_product_shape(self) -> bool:
+        """The electronics order value premium only holds under category/price product weights."""
+        return self.product_zipf is None
+
+    def day_multiplier(self, day: date) -> float:
+        return self.flash_sale_multiplier if day in self.flash_sale_days else 1.0
+
+
+# Named profiles for --skew-profile; parameters are given as name:param (see parse_skew_profile)
+SKEW_PROFILES: Dict[str, SkewProfile] = {
+    "default": SkewProfile(),
+    "uniform": SkewProfile("uniform", product_zipf=0.0, whale_order_weight=1.0, seasonal=False),
+    "zipf": SkewProfile("zipf", product_zipf=1.1),
+    "hot-customer": SkewProfile("hot-customer", hot_customer_share=0.01, hot_customer_order_share=0.5),
+    "flash-sale": SkewProfile(
+        "flash-sale",
+        flash_sale_days=(date(2023, 11, 24), date(2024, 7, 16), date(2024, 11, 29)),
+        flash_sale_multiplier=25.0,
+    ),
+}
+DEFAULT_SKEW = SKEW_PROFILES["default"]
+
 
 # -----------------------------
 # Helper functions
@@ -111,280 +348,547 @@ def ensure_output_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def weighted_choice(options: Sequence, weights: Sequence[float]):
-    return random.choices(options, weights=weights, k=1)[0]
+class AliasSampler:
+    """
+    Walker alias table for repeated draws from a fixed discrete distribution.
+    Built once in O(n); each draw then costs one uniform column pick and one coin flip.
+    """
+
+    def __init__(self, weights: Sequence[float], options: Optional[Sequence] = None):
+        probabilities = np.asarray(weights, dtype=float)
+        if probabilities.ndim != 1 or len(probabilities) == 0 or (probabilities < 0).any() or probabilities.sum() <= 0:
+            raise ValueError("AliasSampler needs a non-empty 1-D vector of non-negative weights with a positive sum")
+        size = len(probabilities)
+        # Plain lists keep the O(n) pairing loop out of numpy's per-element overhead
+        scaled = (probabilities * (size / probabilities.sum())).tolist()
+        accept = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            accept[less] = scaled[less]
+            alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever remains is 1.0 up to rounding error and keeps accept = 1
+        self.accept = np.array(accept)
+        self.alias = np.array(alias)
+        self.options = None if options is None else np.asarray(options)
+
+    def sample(self, size: int) -> np.ndarray:
+        """Draw `size` values (or positions when no options were given)."""
+        positions = self._positions(size)
+        return positions if self.options is None else self.options[positions]
+
+    def sample_categorical(self, size: int) -> pd.Categorical:
+        """Draw `size` options as a categorical built straight from the drawn positions."""
+        if self.options is None:
+            raise ValueError("sample_categorical needs a sampler built with options")
+        return pd.Categorical.from_codes(self._positions(size), categories=self.options)
+
+    def _positions(self, size: int) -> np.ndarray:
+        columns = np.random.randint(0, len(self.accept), size=size)
+        keep = np.random.random(size) < self.accept[columns]
+        return np.where(keep, columns, self.alias[columns])
+
+
+CATEGORY_SAMPLER = AliasSampler(CATEGORY_WEIGHTS, list(CATEGORY_DEFINITION.keys()))
+ITEMS_PER_ORDER_SAMPLER = AliasSampler(ITEMS_PER_ORDER_WEIGHTS, ITEMS_PER_ORDER_OPTIONS)
+QUANTITY_SAMPLER = AliasSampler(QUANTITY_WEIGHTS, QUANTITY_OPTIONS)
+WHALe_QUANTITY_BUMP_SAMPLER = AliasSampler(WHALe_QUANTITY_BUMP_WEIGHTS, WHALe_QUANTITY_BUMP_OPTIONS)
+DISCOUNT_SAMPLER = AliasSampler(DISCOUNT_WEIGHTS, DISCOUNT_OPTIONS)
+ORDER_STATUS_SAMPLER = AliasSampler(ORDER_STATUS_WEIGHTS, ORDER_STATUS_OPTIONS)
+PAYMENT_METHOD_SAMPLER = AliasSampler(PAYMENT_METHOD_WEIGHTS, PAYMENT_METHOD_OPTIONS)
+
+
+def allocate_item_counts(order_count: int, target: int) -> np.ndarray:
+    """
+    Draw a line item count per order, then spread the surplus/deficit over randomly chosen
+    free slots (orders below the max / above the min) so the counts sum exactly to `target`.
+    """
+    min_items, max_items = ITEMS_PER_ORDER_OPTIONS[0], ITEMS_PER_ORDER_OPTIONS[-1]
+    if not min_items * order_count <= target <= max_items * order_count:
+        raise ValueError(
+            f"Cannot allocate {target:,} order items across {order_count:,} orders "
+            f"({min_items}-{max_items} items per order)"
+        )
+
+    counts = ITEMS_PER_ORDER_SAMPLER.sample(order_count)
+    difference = target - int(counts.sum())
+    if difference != 0:
+        headroom = max_items - counts if difference > 0 else counts - min_items
+        slots = np.random.choice(int(headroom.sum()), size=abs(difference), replace=False)
+        owners = np.searchsorted(np.cumsum(headroom), slots, side="right")
+        counts += np.sign(difference) * np.bincount(owners, minlength=order_count)
+    return counts
+
+
+def weighted_sample_without_replacement(weights: np.ndarray, size: int) -> np.ndarray:
+    """
+    Draw `size` distinct indices with probability proportional to `weights` (Efraimidis-Spirakis).
+    Every index gets an exponential key scaled by 1/weight; the smallest keys form the sample,
+    returned in draw order. Runs in linear memory and O(n + k log k) time.
+    """
+    weights = np.asarray(weights, dtype=float)
+    if size > np.count_nonzero(weights > 0):
+        raise ValueError(f"Cannot draw {size:,} distinct items from {np.count_nonzero(weights > 0):,} with positive weight")
+    if size == 0:
+        return np.empty(0, dtype=np.int64)
+    with np.errstate(divide="ignore"):
+        keys = np.random.standard_exponential(len(weights)) / weights
+    chosen = np.argpartition(keys, size - 1)[:size]
+    return chosen[np.argsort(keys[chosen])]
+
+
+def random_dates_between(start: date, end: date, size: int) -> np.ndarray:
+    """Return `size` random datetime64[D] dates between start and end inclusive."""
+    offsets = np.random.randint(0, (end - start).days + 1, size=size)
+    return np.datetime64(start, "D") + offsets
+
+
+def categorical(values, column: str) -> pd.Categorical:
+    """Hold a low-cardinality text column as a categorical, over its fixed vocabulary if it has one."""
+    return pd.Categorical(values, categories=CATEGORY_VOCABULARIES.get(column))
+
+
+def compact_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Restore the compact in-memory dtypes (categorical text, int32 ids, datetime64 dates) on a
+    frame that lost them, e.g. after concatenating shards or reading generated files back.
+    """
+    conversions = {}
+    for column in frame.columns:
+        if column in CATEGORICAL_COLUMNS:
+            conversions[column] = categorical(frame[column], column)
+        elif column in INT32_COLUMNS:
+            conversions[column] = frame[column].astype(np.int32)
+        elif column in DATE_COLUMNS:
+            conversions[column] = pd.to_datetime(frame[column]).astype("datetime64[s]")
+    return frame.assign(**conversions)
+
 
+def bytes_per_row(frames: Dict[str, pd.DataFrame]) -> Dict[str, float]:
+    """Deep in-memory size of each frame divided by its row count."""
+    return {name: frame.memory_usage(deep=True).sum() / max(len(frame), 1) for name, frame in frames.items()}
+
+
+def uncompacted_bytes_per_row(frames: Dict[str, pd.DataFrame], sample_rows: int = 10_000) -> Dict[str, float]:
+    """
+    Estimated bytes per row of the same frames in the generic dtypes compact_frame() replaces
+    (plain strings, int64 ids, Python date objects), measured on the first `sample_rows` rows.
+    """
+    sizes = {}
+    for name, frame in frames.items():
+        sample = frame.head(sample_rows)
+        conversions = {}
+        for column in sample.columns:
+            if isinstance(sample[column].dtype, pd.CategoricalDtype):
+                conversions[column] = sample[column].astype(str)
+            elif column in INT32_COLUMNS:
+                conversions[column] = sample[column].astype(np.int64)
+            elif column in DATE_COLUMNS:
+                dates = sample[column].dt.date.to_numpy(dtype=object)
+                conversions[column] = pd.Series(dates, index=sample.index, dtype=object)
+        sizes[name] = sample.assign(**conversions).memory_usage(deep=True).sum() / max(len(sample), 1)
+    return sizes
+
+
+def build_faker_pools(faker: Faker, pool_size: int) -> FakerPools:
+    """Generate `pool_size` values of every Faker field once, to be reused by index sampling."""
+    return {
+        field: np.array([make_value(faker) for _ in range(pool_size)], dtype=object)
+        for field, make_value in FAKER_FIELDS.items()
+    }
 
-def random_date_between(start: date, end: date) -> date:
-    """Return a random date between start and end inclusive."""
-    delta = (end - start).days
-    offset = random.randint(0, delta)
-    return start + timedelta(days=offset)
 
+def faker_values(faker: Faker, field: str, size: int, pools: Optional[FakerPools] = None) -> np.ndarray:
+    """
+    Return `size` values for a Faker field.
+    With pools, values are sampled by index from the pre-built pool instead of calling Faker per row.
+    """
+    if pools is not None:
+        pool = pools[field]
+        return pool[np.random.randint(0, len(pool), size=size)]
+    make_value = FAKER_FIELDS[field]
+    return np.array([make_value(faker) for _ in range(size)], dtype=object)
 
-def generate_registration_date() -> date:
-    return random_date_between(date(2023, 1, 1), date(2024, 10, 31))
 
+def generate_registration_dates(size: int) -> np.ndarray:
+    return random_dates_between(date(2023, 1, 1), date(2024, 10, 31), size)
 
-def generate_product_created_date() -> date:
-    return random_date_between(date(2022, 1, 1), date(2024, 10, 31))
 
+def generate_product_created_dates(size: int) -> np.ndarray:
+    return random_dates_between(date(2022, 1, 1), date(2024, 10, 31), size)
 
-def generate_order_date(registration_date: date) -> date:
-    """Generate order date >= registration date with seasonal weighting."""
-    max_date = ORDER_END_DATE
-    if registration_date >= max_date:
-        registration_date = max_date - timedelta(days=1)
 
-    while True:
-        year = random.choice([2023, 2024])
-        month = weighted_choice(list(SEASONAL_MONTH_WEIGHTS.keys()), list(SEASONAL_MONTH_WEIGHTS.values()))
-        last_day = (date(year, month, 1) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-        day = random.randint(1, last_day.day)
-        candidate = date(year, month, day)
-        if registration_date <= candidate <= max_date:
-            return candidate
+def parse_skew_profile(spec: str) -> SkewProfile:
+    """
+    Build a SkewProfile from a CLI spec: one or more named profiles joined with "+", each
+    optionally parameterised, e.g. "zipf:1.3", "hot-customer:0.01:0.6" (customer share, order
+    share) or "flash-sale:2024-11-29,2024-12-02:40" (days, volume multiplier).
+    """
+    profile = DEFAULT_SKEW
+    for part in spec.split("+"):
+        name, *params = part.strip().split(":")
+        if name not in SKEW_PROFILES:
+            raise ValueError(f"Unknown skew profile {name!r}; choose from {', '.join(SKEW_PROFILES)}")
+        base = SKEW_PROFILES[name]
+        overrides = {field: value for field, value in vars(base).items() if value != vars(DEFAULT_SKEW)[field]}
+        try:
+            if name == "zipf" and params:
+                overrides["product_zipf"] = float(params[0])
+            elif name == "hot-customer" and params:
+                overrides["hot_customer_share"] = float(params[0])
+                if len(params) > 1:
+                    overrides["hot_customer_order_share"] = float(params[1])
+            elif name == "flash-sale" and params:
+                overrides["flash_sale_days"] = tuple(date.fromisoformat(day) for day in params[0].split(","))
+                if len(params) > 1:
+                    overrides["flash_sale_multiplier"] = float(params[1])
+            elif params:
+                raise ValueError(f"Skew profile {name!r} takes no parameters")
+        except ValueError as exc:
+            raise ValueError(f"Invalid skew profile {part!r}: {exc}") from None
+        profile = replace(profile, **overrides)
+    return replace(profile, name=spec)
+
+
+@lru_cache(maxsize=8)
+def seasonal_day_cdf(skew: SkewProfile = DEFAULT_SKEW) -> np.ndarray:
+    """
+    Cumulative per-day order-date weights from ORDER_START_DATE to ORDER_END_DATE. Each day carries its
+    month's seasonal weight spread evenly over the month's days (flat when the profile turns
+    seasonality off), multiplied up on the profile's flash-sale days.
+    """
+    days = pd.date_range(ORDER_START_DATE, ORDER_END_DATE, freq="D")
+    if skew.seasonal:
+        weights = days.month.map(SEASONAL_MONTH_WEIGHTS).to_numpy(dtype=float) / days.days_in_month.to_numpy()
+    else:
+        weights = np.ones(len(days))
+    for day in skew.flash_sale_days:
+        if ORDER_START_DATE <= day <= ORDER_END_DATE:
+            weights[(day - ORDER_START_DATE).days] *= skew.flash_sale_multiplier
+    return np.cumsum(weights)
 
 
-def build_email(first_name: str, last_name: str, existing_emails: set[str]) -> str:
-    domains = ["example.com", "retailmail.com", "shopmail.com", "gmail.com", "outlook.com"]
+def generate_order_dates(registration_dates: np.ndarray, skew: SkewProfile = DEFAULT_SKEW) -> np.ndarray:
+    """
+    Generate one seasonal order date per registration date, each >= its registration date.
+    Takes and returns datetime64 arrays. Draws by inverse CDF over the allowed suffix of the
+    day calendar, so nothing is rejected.
+    """
+    cdf = seasonal_day_cdf(skew)
+    start = np.datetime64(ORDER_START_DATE, "D")
+    # Registrations on/after ORDER_END_DATE still get at least the final two days to choose from
+    start_offsets = (np.asarray(registration_dates, dtype="datetime64[D]") - start).astype(np.int64)
+    start_offsets = np.clip(start_offsets, 0, len(cdf) - 2)
+
+    lower = np.where(start_offsets > 0, cdf[start_offsets - 1], 0.0)
+    targets = lower + np.random.random(len(start_offsets)) * (cdf[-1] - lower)
+    offsets = np.minimum(np.searchsorted(cdf, targets, side="right"), len(cdf) - 1)
+    return start + offsets
+
+
+def build_email(
+    first_name: str,
+    last_name: str,
+    existing_emails: set[str],
+    next_suffix: Dict[str, int],
+) -> str:
+    """
+    Allocate a unique email, suffixing repeats of the same name/domain with 1, 2, ...
+    `next_suffix` remembers where each base left off, so repeated names never re-probe
+    suffixes that are already taken.
+    """
     base_email = f"{first_name.lower()}.{last_name.lower()}"
-    domain = random.choice(domains)
-    candidate = f"{base_email}@{domain}"
-    suffix = 1
+    return allocate_email(base_email, random.choice(EMAIL_DOMAINS), existing_emails, next_suffix)
+
+
+def allocate_email(
+    base_email: str,
+    domain: str,
+    existing_emails: set[str],
+    next_suffix: Dict[str, int],
+) -> str:
+    """Return the first free `base_email[N]@domain`, resuming from the base's last suffix."""
+    key = f"{base_email}@{domain}"
+    suffix = next_suffix.get(key, 0)
+    candidate = key if suffix == 0 else f"{base_email}{suffix}@{domain}"
+    # A suffixed address can still clash with a different base (e.g. "ann.lee1"), so confirm against the set
     while candidate in existing_emails:
-        candidate = f"{base_email}{suffix}@{domain}"
         suffix += 1
+        candidate = f"{base_email}{suffix}@{domain}"
+    next_suffix[key] = suffix + 1
     existing_emails.add(candidate)
     return candidate
 
 
-def select_product_for_order(
-    products: pd.DataFrame,
-    is_whale: bool,
-    non_whale_weights: np.ndarray,
-    whale_weights: np.ndarray,
-) -> pd.Series:
-    """Weighted random product selection emphasising electronics and high-value items for whales."""
-    weights = whale_weights if is_whale else non_whale_weights
-    idx = np.random.choice(products.index.values, p=weights)
-    return products.loc[idx]
-
-
-def rating_probabilities(price_percentile: float) -> List[float]:
-    """
-    Adjust rating distribution based on product price percentile.
-    Higher percentile -> better reviews.
-    """
-    base = np.array([0.40, 0.30, 0.15, 0.10, 0.05])  # ratings 5..1
-    shift_strength = (price_percentile - 0.5) * 0.30  # amplify by +/- 15%
-    # Positive shift moves probability mass towards higher ratings
-    if shift_strength > 0:
-        transfer = min(shift_strength, 0.20)
-        base[0] += transfer
-        base[1] += transfer / 2
-        base[3] -= transfer / 2
-        base[4] -= transfer
-    else:
-        transfer = min(abs(shift_strength), 0.20)
-        base[0] -= transfer
-        base[1] -= transfer / 2
-        base[3] += transfer / 2
-        base[4] += transfer
-    # Ensure no negative probabilities and normalise
-    base = np.clip(base, 0.01, None)
-    base = base / base.sum()
-    return base.tolist()
+def deduplicate_emails(emails: Sequence[str]) -> List[str]:
+    """Re-suffix repeated addresses (keeping the first occurrence), e.g. after merging shards."""
+    existing_emails = set(emails)
+    next_suffix: Dict[str, int] = {}
+    seen: set[str] = set()
+    unique_emails = []
+    for email in emails:
+        if email in seen:
+            local_part, domain = email.split("@", 1)
+            email = allocate_email(local_part, domain, existing_emails, next_suffix)
+        seen.add(email)
+        unique_emails.append(email)
+    return unique_emails
 
 
-def rating_text_template(rating: int, product_category: str) -> str:
-    positive_templates = {
-        "Electronics": [
-            "Performance exceeded expectations with seamless setup.",
-            "Battery life and build quality are top-notch.",
-        ],
-        "Clothing": [
-            "Fits perfectly and fabric feels premium.",
-            "Stylish and comfortable for everyday wear.",
-        ],
-        "Home & Garden": [
-            "Quality craftsmanship and easy assembly.",
-            "Adds instant charm to the space.",
-        ],
-        "Sports": [
-            "Great durability during intense workouts.",
-            "Lightweight and enhances performance.",
-        ],
-        "Books": [
-            "Engaging read with well-developed characters.",
-            "Extremely informative and well structured.",
-        ],
-    }
-    neutral_templates = [
-        "Overall solid value though a few minor quirks.",
-        "Meets expectations but could use refinements.",
-    ]
-    negative_templates = [
-        "Item quality did not match the description.",
-        "Had issues shortly after purchase; disappointed.",
-    ]
+def email_suffix_counters(emails: Iterable[str]) -> Dict[str, int]:
+    """
+    Rebuild allocate_email's next-suffix counters from addresses already allocated, e.g. when
+    appending to a dataset on disk: each name/domain base resumes after its highest suffix.
+    """
+    parts = pd.Series(list(emails), dtype=object).str.extract(r"^(?P<base>.*?)(?P<suffix>\d*)@(?P<domain>.*)$")
+    if parts.empty:
+        return {}
+    suffixes = pd.to_numeric(parts["suffix"].replace("", "0"))
+    keys = parts["base"] + "@" + parts["domain"]
+    return (suffixes.groupby(keys).max() + 1).to_dict()
+
 
-    if rating >= 4:
-        return random.choice(positive_templates.get(product_category, neutral_templates))
-    if rating == 3:
-        return random.choice(neutral_templates)
-    return random.choice(negative_templates)
+def rating_probability_matrix(price_percentiles: np.ndarray) -> np.ndarray:
+    """
+    Adjust rating distribution based on product price percentile, one row per product.
+    Higher percentile -> better reviews. Columns are ratings 5..1.
+    """
+    price_percentiles = np.asarray(price_percentiles, dtype=float)
+    base = np.tile([0.40, 0.30, 0.15, 0.10, 0.05], (len(price_percentiles), 1))
+    shift_strength = (price_percentiles - 0.5) * 0.30  # amplify by +/- 15%
+    # Positive shift moves probability mass towards higher ratings, negative towards lower
+    transfer = np.sign(shift_strength) * np.minimum(np.abs(shift_strength), 0.20)
+    base[:, 0] += transfer
+    base[:, 1] += transfer / 2
+    base[:, 3] -= transfer / 2
+    base[:, 4] -= transfer
+    # Ensure no negative probabilities and normalise
+    base = np.clip(base, 0.01, None)
+    return base / base.sum(axis=1, keepdims=True)
+
+
+def review_texts(ratings: np.ndarray, categories: np.ndarray) -> np.ndarray:
+    """Pick a template text per review from its rating bucket and product category."""
+    texts = np.empty(len(ratings), dtype=object)
+    for category in np.unique(categories):
+        in_category = categories == category
+        buckets = (
+            (ratings >= 4, POSITIVE_REVIEW_TEMPLATES.get(category, NEUTRAL_REVIEW_TEMPLATES)),
+            (ratings == 3, NEUTRAL_REVIEW_TEMPLATES),
+            (ratings <= 2, NEGATIVE_REVIEW_TEMPLATES),
+        )
+        for in_bucket, templates in buckets:
+            mask = in_category & in_bucket
+            texts[mask] = np.asarray(templates, dtype=object)[np.random.randint(0, len(templates), size=mask.sum())]
+    return texts
 
 
 # -----------------------------
 # Generators
 # -----------------------------
 
-def generate_products(faker: Faker, config: GenerationConfig) -> pd.DataFrame:
-    products_records = []
-    for product_id in range(1, config.products + 1):
-        category = weighted_choice(
-            list(CATEGORY_DEFINITION.keys()),
-            [0.30, 0.25, 0.20, 0.15, 0.10],
-        )
-        subcategories, (min_price, max_price) = CATEGORY_DEFINITION[category]
-        subcategory = random.choice(subcategories)
-        price = round(random.uniform(min_price, max_price), 2)
-        margin = random.uniform(0.20, 0.50)
-        cost = round(price * (1 - margin), 2)
-        products_records.append(
-            {
-                "product_id": product_id,
-                "name": faker.catch_phrase(),
-                "category": category,
-                "subcategory": subcategory,
-                "price": price,
-                "cost": cost,
-                "stock_quantity": random.randint(10, 1_000),
-                "supplier": faker.company(),
-                "created_date": generate_product_created_date(),
-            }
-        )
-    df = pd.DataFrame(products_records)
-    return df
-
-
-def generate_customers(faker: Faker, config: GenerationConfig) -> pd.DataFrame:
-    customer_records = []
-    unique_emails: set[str] = set()
-    for customer_id in range(1, config.customers + 1):
-        first_name = faker.first_name()
-        last_name = faker.last_name()
-        address = faker.street_address()
-        city = faker.city()
-        state = faker.state_abbr()
-        postal_code = faker.zipcode()
-        country = "USA"
-        registration_date = generate_registration_date()
-        customer_records.append(
-            {
-                "customer_id": customer_id,
-                "first_name": first_name,
-                "last_name": last_name,
-                "email": build_email(first_name, last_name, unique_emails),
-                "phone": faker.numerify("###-###-####"),
-                "address": address,
-                "city": city,
-                "state": state,
-                "zip": postal_code,
-                "country": country,
-                "registration_date": registration_date,
-            }
-        )
-    return pd.DataFrame(customer_records)
-
-
-def choose_shipping_address(faker: Faker, customer_row: pd.Series) -> Tuple[str, str, str, str, str]:
-    """Mostly reuse customer address; occasionally ship to alternate location."""
-    if random.random() < 0.85:
-        return (
-            customer_row["address"],
-            customer_row["city"],
-            customer_row["state"],
-            customer_row["zip"],
-            customer_row["country"],
-        )
-    return (
-        faker.street_address(),
-        faker.city(),
-        faker.state_abbr(),
-        faker.zipcode(),
-        "USA",
+def generate_products(faker: Faker, config: GenerationConfig, pools: Optional[FakerPools] = None) -> pd.DataFrame:
+    count = config.products
+    categories = CATEGORY_SAMPLER.sample_categorical(count)
+
+    # Per-category subcategory and price bounds, resolved one category group at a time
+    subcategories = np.empty(count, dtype=object)
+    min_prices = np.empty(count)
+    max_prices = np.empty(count)
+    for category, (category_subcategories, (min_price, max_price)) in CATEGORY_DEFINITION.items():
+        in_category = categories == category
+        options = np.asarray(category_subcategories, dtype=object)
+        subcategories[in_category] = options[np.random.randint(0, len(options), size=in_category.sum())]
+        min_prices[in_category] = min_price
+        max_prices[in_category] = max_price
+
+    prices = np.round(np.random.uniform(min_prices, max_prices), 2)
+    margins = np.random.uniform(0.20, 0.50, size=count)
+    # Clamp the cost in integer cents to one cent inside the 20-50% margin band enforced by
+    # validation and the schema; a cost on the band edge can miss it by a float rounding error
+    price_cents = np.round(prices * 100).astype(np.int64)
+    cost_cents = np.clip(
+        np.round(price_cents * (1 - margins)).astype(np.int64),
+        (price_cents + 1) // 2 + 1,
+        price_cents * 4 // 5 - 1,
+    )
+    costs = cost_cents / 100
+    return pd.DataFrame(
+        {
+            "product_id": np.arange(1, count + 1, dtype=np.int32),
+            "name": faker_values(faker, "catch_phrase", count, pools),
+            "category": categories,
+            "subcategory": categorical(subcategories, "subcategory"),
+            "price": prices,
+            "cost": costs,
+            "stock_quantity": np.random.randint(10, 1_001, size=count).astype(np.int32),
+            "supplier": faker_values(faker, "company", count, pools),
+            "created_date": generate_product_created_dates(count),
+        }
     )
 
 
+def generate_customers(
+    faker: Faker,
+    config: GenerationConfig,
+    pools: Optional[FakerPools] = None,
+    first_customer_id: int = 1,
+    unique_emails: Optional[set[str]] = None,
+    email_suffixes: Optional[Dict[str, int]] = None,
+) -> pd.DataFrame:
+    """
+    Pass `unique_emails` and `email_suffixes` to keep emails unique across calls; both are
+    updated in place with the addresses allocated here.
+    """
+    count = config.customers
+    first_names = faker_values(faker, "first_name", count, pools)
+    last_names = faker_values(faker, "last_name", count, pools)
+    if unique_emails is None:
+        unique_emails = set()
+    if email_suffixes is None:
+        email_suffixes = {}
+    return pd.DataFrame(
+        {
+            "customer_id": np.arange(first_customer_id, first_customer_id + count, dtype=np.int32),
+            "first_name": categorical(first_names, "first_name"),
+            "last_name": categorical(last_names, "last_name"),
+            "email": [
+                build_email(first_name, last_name, unique_emails, email_suffixes)
+                for first_name, last_name in zip(first_names, last_names)
+            ],
+            "phone": faker_values(faker, "phone", count, pools),
+            "address": faker_values(faker, "street_address", count, pools),
+            "city": categorical(faker_values(faker, "city", count, pools), "city"),
+            "state": categorical(faker_values(faker, "state_abbr", count, pools), "state"),
+            "zip": categorical(faker_values(faker, "zipcode", count, pools), "zip"),
+            "country": pd.Categorical.from_codes(np.zeros(count, dtype=np.int8), categories=["USA"]),
+            "registration_date": generate_registration_dates(count),
+        }
+    )
+
+
+def choose_shipping_addresses(
+    faker: Faker,
+    customers: pd.DataFrame,
+    customer_positions: np.ndarray,
+    pools: Optional[FakerPools] = None,
+) -> Dict[str, pd.Categorical]:
+    """
+    Mostly reuse each order's customer address; occasionally ship to an alternate location.
+    The 85/15 split is drawn for all orders at once, customer addresses are gathered by
+    position, and alternates are sampled from the Faker pools or, without them, from a pool
+    of at most SHIPPING_ADDRESS_POOL_SIZE addresses drawn once for this batch.
+    """
+    alternate = np.flatnonzero(np.random.random(len(customer_positions)) >= 0.85)
+    if pools is None:
+        pool_size = max(1, min(len(alternate), SHIPPING_ADDRESS_POOL_SIZE))
+        pools = {
+            field: faker_values(faker, field, pool_size) for field in ("street_address", "city", "state_abbr", "zipcode")
+        }
+    alternate_fields = {
+        "address": faker_values(faker, "street_address", len(alternate), pools),
+        "city": faker_values(faker, "city", len(alternate), pools),
+        "state": faker_values(faker, "state_abbr", len(alternate), pools),
+        "zip": faker_values(faker, "zipcode", len(alternate), pools),
+        "country": "USA",
+    }
+    shipping = {}
+    for field, alternate_values in alternate_fields.items():
+        values = np.array(customers[field].array.take(customer_positions), dtype=object)
+        values[alternate] = alternate_values
+        shipping[f"shipping_{field}"] = categorical(values, f"shipping_{field}")
+    return shipping
+
+
+def select_whale_ids(customers: pd.DataFrame) -> set[int]:
+    whale_count = int(len(customers) * WHALe_SHARE)
+    return set(random.sample(list(customers["customer_id"]), whale_count))
+
+
+def stable_id_hash(ids: np.ndarray) -> np.ndarray:
+    """
+    SplitMix64 finaliser over ids. Gives every id a fixed pseudo-random 64-bit key, so hot sets
+    and popularity ranks agree across shards, chunks and appends without touching the RNG.
+    """
+    keys = np.asarray(ids).astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    keys = (keys ^ (keys >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    keys = (keys ^ (keys >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return keys ^ (keys >> np.uint64(31))
+
+
+def build_customer_sampler(
+    customers: pd.DataFrame,
+    whale_ids: set[int],
+    skew: SkewProfile = DEFAULT_SKEW,
+) -> AliasSampler:
+    """
+    Customer position sampler biased towards whales by the profile's whale order weight. A
+    hot-customer profile then rescales its hot set (the customers with the smallest id hashes)
+    so that it receives exactly the configured share of all orders.
+    """
+    is_whale = customers["customer_id"].isin(whale_ids).to_numpy()
+    weights = np.where(is_whale, skew.whale_order_weight, 1).astype(float)
+    hot_count = max(1, round(len(customers) * skew.hot_customer_share)) if skew.hot_customer_share else 0
+    if 0 < hot_count < len(customers):
+        hot = np.argpartition(stable_id_hash(customers["customer_id"].to_numpy()), hot_count - 1)[:hot_count]
+        is_hot = np.zeros(len(customers), dtype=bool)
+        is_hot[hot] = True
+        target_ratio = skew.hot_customer_order_share / (1 - skew.hot_customer_order_share)
+        weights[is_hot] *= target_ratio * weights[~is_hot].sum() / weights[is_hot].sum()
+    return AliasSampler(weights)
+
+
 def generate_orders(
     faker: Faker,
     customers: pd.DataFrame,
     config: GenerationConfig,
     whale_ids: set[int],
+    pools: Optional[FakerPools] = None,
+    first_order_id: int = 1,
+    customer_sampler: Optional[AliasSampler] = None,
+    skew: SkewProfile = DEFAULT_SKEW,
 ) -> pd.DataFrame:
-    customer_weights = customers["customer_id"].apply(
-        lambda cid: WHALe_ORDER_WEIGHT if cid in whale_ids else 1
-    )
-    probabilities = customer_weights / customer_weights.sum()
-
-    orders = []
-    for order_id in tqdm(range(1, config.orders + 1), desc="Generating orders", unit="order"):
-        customer_id = int(np.random.choice(customers["customer_id"], p=probabilities))
-        customer_row = customers.loc[customers["customer_id"] == customer_id].iloc[0]
-        order_date = generate_order_date(customer_row["registration_date"])
-        shipping_address, shipping_city, shipping_state, shipping_zip, shipping_country = choose_shipping_address(faker, customer_row)
-        orders.append(
-            {
-                "order_id": order_id,
-                "customer_id": customer_id,
-                "order_date": order_date,
-                "status": weighted_choice(ORDER_STATUS_OPTIONS, ORDER_STATUS_WEIGHTS),
-                "payment_method": weighted_choice(PAYMENT_METHOD_OPTIONS, PAYMENT_METHOD_WEIGHTS),
-                "shipping_address": shipping_address,
-                "shipping_city": shipping_city,
-                "shipping_state": shipping_state,
-                "shipping_zip": shipping_zip,
-                "shipping_country": shipping_country,
-                "total_amount": 0.0,  # placeholder to be populated once items are generated
-            }
-        )
-    return pd.DataFrame(orders)
+    if customer_sampler is None:
+        customer_sampler = build_customer_sampler(customers, whale_ids, skew)
 
+    # Draw every order's customer at once and gather its attributes positionally
+    customer_positions = customer_sampler.sample(config.orders)
+    registration_dates = customers["registration_date"].to_numpy()[customer_positions]
 
-def generate_order_items(
-    orders: pd.DataFrame,
+    order_dates = generate_order_dates(registration_dates, skew)
+    shipping = choose_shipping_addresses(faker, customers, customer_positions, pools)
+
+    return pd.DataFrame(
+        {
+            "order_id": np.arange(first_order_id, first_order_id + config.orders, dtype=np.int32),
+            "customer_id": customers["customer_id"].to_numpy()[customer_positions],
+            "order_date": order_dates,
+            "status": ORDER_STATUS_SAMPLER.sample_categorical(config.orders),
+            "payment_method": PAYMENT_METHOD_SAMPLER.sample_categorical(config.orders),
+            **shipping,
+            "total_amount": 0.0,  # placeholder to be populated once items are generated
+        }
+    )
+
+
+def build_product_samplers(
     products: pd.DataFrame,
-    config: GenerationConfig,
-    whale_ids: set[int],
-) -> pd.DataFrame:
-    """Generate order items for each order while enforcing target line item count."""
-    orders.reset_index(drop=True, inplace=True)
+    skew: SkewProfile = DEFAULT_SKEW,
+) -> Tuple[AliasSampler, AliasSampler]:
+    """
+    Non-whale and whale product position samplers with electronics and price emphasis. A Zipf
+    profile replaces both with weight 1/rank^s over a fixed pseudo-random product ranking.
+    """
+    if skew.product_zipf is not None:
+        ranks = np.empty(len(products))
+        ranks[np.argsort(stable_id_hash(products["product_id"].to_numpy()))] = np.arange(1, len(products) + 1)
+        sampler = AliasSampler(ranks ** -skew.product_zipf)
+        return sampler, sampler
 
-    # Pre-compute items per order
-    base_counts = np.random.choice(
-        [1, 2, 3, 4, 5],
-        size=len(orders),
-        p=[0.10, 0.35, 0.30, 0.15, 0.10],
-    )
-
-    total_items = base_counts.sum()
-    target = config.order_items
-
-    # Adjust counts to reach the exact target
-    while total_items < target:
-        idx = random.randrange(len(base_counts))
-        if base_counts[idx] < 5:
-            base_counts[idx] += 1
-            total_items += 1
-    while total_items > target:
-        idx = random.randrange(len(base_counts))
-        if base_counts[idx] > 1:
-            base_counts[idx] -= 1
-            total_items -= 1
-
-    # Precompute selection weights with electronics and price emphasis
     category_weight_map = {
         "Electronics": 2.2,
         "Clothing": 1.0,
@@ -397,45 +901,62 @@ def generate_order_items(
     price_percentiles = products["price"].rank(pct=True).values
     non_whale_weights = category_weights_series.values * (0.65 + 0.70 * price_percentiles)
     whale_weights = category_weights_series.values * (0.85 + 1.10 * price_percentiles)
-    non_whale_weights = non_whale_weights / non_whale_weights.sum()
-    whale_weights = whale_weights / whale_weights.sum()
-
-    order_items_records = []
-
-    item_id = 1
-    for order_idx, order_row in tqdm(orders.iterrows(), total=len(orders), desc="Generating order items", unit="order"):
-        items_count = base_counts[order_idx]
-        is_whale = order_row["customer_id"] in whale_ids
-
-        for _ in range(items_count):
-            product = select_product_for_order(products, is_whale, non_whale_weights, whale_weights)
-            quantity = int(np.random.choice(
-                [1, 2, 3, 4, 5],
-                p=[0.45, 0.30, 0.15, 0.07, 0.03],
-            ))
-            if is_whale:
-                quantity = min(quantity + np.random.choice([0, 1], p=[0.7, 0.3]), 5)
-            unit_price = round(product["price"] * np.random.uniform(0.95, 1.05), 2)
-            discount = np.random.choice(DISCOUNT_OPTIONS, p=DISCOUNT_WEIGHTS)
-            line_total = round(quantity * unit_price * (1 - discount), 2)
-            order_items_records.append(
-                {
-                    "order_item_id": item_id,
-                    "order_id": order_row["order_id"],
-                    "product_id": int(product["product_id"]),
-                    "quantity": quantity,
-                    "unit_price": unit_price,
-                    "discount": discount,
-                    "line_total": line_total,
-                }
-            )
-            item_id += 1
+    return AliasSampler(non_whale_weights), AliasSampler(whale_weights)
 
-    order_items_df = pd.DataFrame(order_items_records)
+
+def generate_order_items(
+    orders: pd.DataFrame,
+    products: pd.DataFrame,
+    config: GenerationConfig,
+    whale_ids: set[int],
+    first_item_id: int = 1,
+    product_samplers: Optional[Tuple[AliasSampler, AliasSampler]] = None,
+    skew: SkewProfile = DEFAULT_SKEW,
+) -> pd.DataFrame:
+    """Generate order items for each order while enforcing target line item count."""
+    orders.reset_index(drop=True, inplace=True)
+
+    # Pre-compute items per order, adjusted to hit the exact line item target
+    base_counts = allocate_item_counts(len(orders), config.order_items)
+
+    if product_samplers is None:
+        product_samplers = build_product_samplers(products, skew)
+    non_whale_sampler, whale_sampler = product_samplers
+
+    # Expand orders into one row per line item and draw every line attribute in bulk
+    order_positions = np.repeat(np.arange(len(orders)), base_counts)
+    line_count = len(order_positions)
+    line_is_whale = orders["customer_id"].isin(whale_ids).to_numpy()[order_positions]
+    whale_lines = np.flatnonzero(line_is_whale)
+    non_whale_lines = np.flatnonzero(~line_is_whale)
+
+    product_positions = np.empty(line_count, dtype=np.int64)
+    product_positions[whale_lines] = whale_sampler.sample(len(whale_lines))
+    product_positions[non_whale_lines] = non_whale_sampler.sample(len(non_whale_lines))
+
+    quantities = QUANTITY_SAMPLER.sample(line_count)
+    whale_bump = WHALe_QUANTITY_BUMP_SAMPLER.sample(len(whale_lines))
+    quantities[whale_lines] = np.minimum(quantities[whale_lines] + whale_bump, 5)
+
+    base_prices = products["price"].to_numpy(dtype=float)[product_positions]
+    unit_prices = np.round(base_prices * np.random.uniform(0.95, 1.05, size=line_count), 2)
+    discounts = DISCOUNT_SAMPLER.sample(line_count)
+    line_totals = np.round(quantities * unit_prices * (1 - discounts), 2)
+
+    order_items_df = pd.DataFrame(
+        {
+            "order_item_id": np.arange(first_item_id, first_item_id + line_count, dtype=np.int32),
+            "order_id": orders["order_id"].to_numpy()[order_positions],
+            "product_id": products["product_id"].to_numpy()[product_positions],
+            "quantity": quantities.astype(np.int32),
+            "unit_price": unit_prices,
+            "discount": discounts,
+            "line_total": line_totals,
+        }
+    )
 
     # Update order totals
-    totals = order_items_df.groupby("order_id")["line_total"].sum()
-    orders["total_amount"] = orders["order_id"].map(totals).fillna(0.0)
+    orders["total_amount"] = np.bincount(order_positions, weights=line_totals, minlength=len(orders))
 
     return order_items_df
 
@@ -445,53 +966,276 @@ def generate_reviews(
     order_items: pd.DataFrame,
     products: pd.DataFrame,
     config: GenerationConfig,
+    first_review_id: int = 1,
+    order_end_date: date = ORDER_END_DATE,
 ) -> pd.DataFrame:
-    orders_subset = orders[["order_id", "customer_id", "order_date"]]
-    merged = order_items.merge(orders_subset, on="order_id", how="left", validate="many_to_one")
-    merged = merged.merge(products[["product_id", "category", "price"]], on="product_id", how="left", validate="many_to_one")
-
     # Weight selection by revenue to ensure popular products accrue more reviews
-    weights = merged["line_total"].values
+    weights = order_items["line_total"].to_numpy(dtype=float)
     weights = np.where(weights <= 0, 0.01, weights)
-    weights = weights / weights.sum()
-    chosen_indices = np.random.choice(
-        len(merged),
-        size=config.reviews,
-        replace=False,
-        p=weights,
-    )
-
-    # Pre-compute price percentiles
-    product_price_percentiles = products.set_index("product_id")["price"].rank(pct=True)
-
-    reviews_records = []
-    for review_id, idx in enumerate(chosen_indices, start=1):
-        row = merged.iloc[idx]
-        price_pct = float(product_price_percentiles.loc[row["product_id"]])
-        rating_probs = rating_probabilities(price_pct)
-        rating = random.choices([5, 4, 3, 2, 1], weights=rating_probs, k=1)[0]
-        review_date = row["order_date"] + timedelta(days=random.randint(1, 60))
-        if review_date > ORDER_END_DATE + timedelta(days=60):
-            review_date = ORDER_END_DATE + timedelta(days=random.randint(1, 45))
-
-        reviews_records.append(
-            {
-                "review_id": review_id,
-                "product_id": int(row["product_id"]),
-                "customer_id": int(row["customer_id"]),
-                "rating": rating,
-                "review_text": rating_text_template(rating, row["category"]),
-                "review_date": review_date,
-            }
-        )
+    chosen_indices = weighted_sample_without_replacement(weights, config.reviews)
+
+    # Resolve the chosen lines' orders and products positionally instead of merging every line
+    chosen_items = order_items.iloc[chosen_indices]
+    order_positions = pd.Index(orders["order_id"]).get_indexer(chosen_items["order_id"])
+    product_positions = pd.Index(products["product_id"]).get_indexer(chosen_items["product_id"])
+
+    # Sample every rating at once from its product's row of the rating distribution matrix
+    rating_matrix = rating_probability_matrix(products["price"].rank(pct=True).to_numpy())
+    cumulative = rating_matrix[product_positions].cumsum(axis=1)
+    draws = np.random.random(config.reviews)[:, None]
+    ratings = RATING_VALUES[np.minimum((draws >= cumulative).sum(axis=1), len(RATING_VALUES) - 1)]
+
+    order_dates = np.asarray(orders["order_date"].to_numpy()[order_positions], dtype="datetime64[D]")
+    review_dates = order_dates + np.random.randint(1, 61, size=config.reviews)
+    latest_review_date = np.datetime64(order_end_date + timedelta(days=60), "D")
+    late = review_dates > latest_review_date
+    review_dates[late] = np.datetime64(order_end_date, "D") + np.random.randint(1, 46, size=late.sum())
+
+    return pd.DataFrame(
+        {
+            "review_id": np.arange(first_review_id, first_review_id + config.reviews, dtype=np.int32),
+            "product_id": chosen_items["product_id"].to_numpy(),
+            "customer_id": orders["customer_id"].to_numpy()[order_positions],
+            "rating": ratings.astype(np.int32),
+            "review_text": categorical(
+                review_texts(ratings, products["category"].to_numpy()[product_positions]), "review_text"
+            ),
+            "review_date": review_dates,
+        }
+    )
+
+
+def assign_time_ordered_ids(
+    orders: pd.DataFrame,
+    order_items: pd.DataFrame,
+    reviews: pd.DataFrame,
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Reorder orders by order_date and reviews by review_date and renumber them over their
+    existing id ranges, then carry the new order ids into the items, which are regrouped and
+    renumbered in order-id order. Row order and id order then both follow time, so date-range
+    scans read contiguous rowid ranges.
+    """
+    order_sort = np.argsort(np.asarray(orders["order_date"], dtype="datetime64[D]"), kind="stable")
+    orders = orders.iloc[order_sort].reset_index(drop=True)
+    first_order_id = int(orders["order_id"].min()) if len(orders) else 1
+    order_positions = pd.Index(orders["order_id"]).get_indexer(order_items["order_id"])
+    orders["order_id"] = np.arange(first_order_id, first_order_id + len(orders), dtype=np.int32)
+
+    item_ids = order_items["order_item_id"].to_numpy()
+    item_sort = np.lexsort((item_ids, order_positions))
+    order_items = order_items.iloc[item_sort].reset_index(drop=True)
+    order_items["order_id"] = (first_order_id + order_positions[item_sort]).astype(np.int32)
+    order_items["order_item_id"] = np.sort(item_ids)
 
-    return pd.DataFrame(reviews_records)
+    review_sort = np.argsort(np.asarray(reviews["review_date"], dtype="datetime64[D]"), kind="stable")
+    reviews = reviews.iloc[review_sort].reset_index(drop=True)
+    reviews["review_id"] = np.sort(reviews["review_id"].to_numpy())
+    return orders, order_items, reviews
 
 
 # -----------------------------
 # Validation
 # -----------------------------
 
+class Reservoir:
+    """
+    Uniform fixed-size sample over rows offered in any number of batches (Algorithm R, with
+    each batch's replacement draws vectorised). Uses its own generator so sampling never
+    shifts the data-generation random stream.
+    """
+
+    def __init__(self, size: int, rng: np.random.Generator):
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.columns: Dict[str, np.ndarray] = {}
+
+    def offer(self, frame: pd.DataFrame) -> None:
+        if not self.columns:
+            self.columns = {column: frame[column].to_numpy()[:0] for column in frame.columns}
+        filled = len(next(iter(self.columns.values())))
+        take = min(self.size - filled, len(frame))
+        if take > 0:
+            self.columns = {
+                column: np.concatenate([values, frame[column].to_numpy()[:take]])
+                for column, values in self.columns.items()
+            }
+
+        # Row i of the stream (0-based) replaces a random slot with probability size / (i + 1)
+        stream_positions = self.seen + np.arange(take, len(frame))
+        slots = self.rng.integers(0, stream_positions + 1) if len(stream_positions) else stream_positions
+        accepted = np.flatnonzero(slots < self.size)
+        if len(accepted):
+            # When one slot is hit several times in a batch, the latest row wins as in the serial algorithm
+            latest = np.full(self.size, -1)
+            np.maximum.at(latest, slots[accepted], accepted)
+            replaced = np.flatnonzero(latest >= 0)
+            for column, values in self.columns.items():
+                values[replaced] = frame[column].to_numpy()[take + latest[replaced]]
+        self.seen += len(frame)
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns)
+
+
+def order_summaries(
+    orders: pd.DataFrame,
+    order_items: pd.DataFrame,
+    products: pd.DataFrame,
+    whale_ids: set[int],
+) -> pd.DataFrame:
+    """
+    One row per order with its item revenue, whale flag and whether it contains electronics,
+    built with positional gathers and bincounts instead of merges.
+    """
+    order_positions = pd.Index(orders["order_id"]).get_indexer(order_items["order_id"])
+    product_positions = pd.Index(products["product_id"]).get_indexer(order_items["product_id"])
+    assert (order_positions >= 0).all(), "Order item references unknown order"
+    assert (product_positions >= 0).all(), "Order item references unknown product"
+
+    item_is_electronics = products["category"].to_numpy()[product_positions] == "Electronics"
+    whale_array = np.fromiter(whale_ids, dtype=np.int64, count=len(whale_ids))
+    return pd.DataFrame(
+        {
+            "customer_id": orders["customer_id"].to_numpy(),
+            "order_date": orders["order_date"].to_numpy(),
+            "revenue": np.bincount(order_positions, weights=order_items["line_total"], minlength=len(orders)),
+            "is_whale": np.isin(orders["customer_id"].to_numpy(), whale_array),
+            "has_electronics": np.bincount(order_positions, weights=item_is_electronics, minlength=len(orders)) > 0,
+        }
+    )
+
+
+def check_references(
+    customers: pd.DataFrame,
+    products: pd.DataFrame,
+    orders: pd.DataFrame,
+    reviews: pd.DataFrame,
+) -> None:
+    """Orders and reviews point at known customers/products and no order predates its customer."""
+    customer_index = pd.Index(customers["customer_id"])
+    customer_positions = customer_index.get_indexer(orders["customer_id"])
+    assert (customer_positions >= 0).all(), "Order references unknown customer"
+    assert (customer_index.get_indexer(reviews["customer_id"]) >= 0).all(), "Review references unknown customer"
+    product_positions = pd.Index(products["product_id"]).get_indexer(reviews["product_id"])
+    assert (product_positions >= 0).all(), "Review references unknown product"
+
+    registration_dates = customers["registration_date"].to_numpy()[customer_positions]
+    assert (orders["order_date"].to_numpy() >= registration_dates).all(), "Order predates customer registration"
+
+
+def check_revenue_shape(
+    summaries: pd.DataFrame,
+    discounts: np.ndarray,
+    skew: SkewProfile = DEFAULT_SKEW,
+    z: float = 0.0,
+    order_population: Optional[int] = None,
+    item_population: Optional[int] = None,
+) -> Dict[str, float]:
+    """
+    Whale revenue share, electronics order value premium and discount mix. With z > 0 the
+    inputs are uniform samples of the given populations and each check only fails once its
+    z-sigma confidence bound is outside the allowed range; z = 0 applies the thresholds to
+    exact population values. All checks are skipped below MIN_SHAPE_CHECK_ROWS orders or items.
+    """
+
+    def bound(standard_error: float, sample_size: int, population: Optional[int]) -> float:
+        # Finite population correction: a sample that covers everything has no sampling error
+        if population and population > 1:
+            standard_error *= math.sqrt(max(population - sample_size, 0) / (population - 1))
+        return z * standard_error
+
+    order_count = order_population or len(summaries)
+    item_count = item_population or len(discounts)
+    if order_count < MIN_SHAPE_CHECK_ROWS or item_count < MIN_SHAPE_CHECK_ROWS:
+        print(f"  skipping revenue-shape checks below {MIN_SHAPE_CHECK_ROWS:,} orders or order items")
+        return {}
+
+    revenue = summaries["revenue"].to_numpy()
+    is_whale = summaries["is_whale"].to_numpy()
+    has_electronics = summaries["has_electronics"].to_numpy()
+    sample_size = len(summaries)
+    observed: Dict[str, float] = {}
+
+    total_revenue = revenue.sum()
+    if total_revenue > 0 and skew.keeps_customer_shape:
+        whale_share = revenue[is_whale].sum() / total_revenue
+        margin = 0.0
+        if z > 0 and sample_size > 1:
+            # Ratio-estimator standard error of sum(whale revenue) / sum(revenue)
+            residuals = np.where(is_whale, revenue, 0.0) - whale_share * revenue
+            standard_error = math.sqrt((residuals**2).sum() / (sample_size * (sample_size - 1))) / revenue.mean()
+            margin = bound(standard_error, sample_size, order_population)
+        observed["whale_revenue_share"] = whale_share
+        observed["whale_revenue_share_margin"] = margin
+        assert whale_share + margin >= WHALe_REVENUE_TARGET - 0.02, f"Whale revenue share too low: {whale_share:.2%}"
+
+    electronics, other = revenue[has_electronics], revenue[~has_electronics]
+    if skew.keeps_product_shape and len(electronics) and len(other):
+        difference = electronics.mean() - other.mean()
+        margin = 0.0
+        if z > 0 and len(electronics) > 1 and len(other) > 1:
+            standard_error = math.sqrt(electronics.var(ddof=1) / len(electronics) + other.var(ddof=1) / len(other))
+            margin = bound(standard_error, sample_size, order_population)
+        observed["electronics_order_premium"] = difference
+        observed["electronics_order_premium_margin"] = margin
+        assert difference + margin >= 0, "Electronics orders should have higher average value"
+
+    if len(discounts):
+        for discount, expected in zip(DISCOUNT_OPTIONS, DISCOUNT_WEIGHTS):
+            share = float(np.mean(discounts == discount))
+            margin = bound(math.sqrt(expected * (1 - expected) / len(discounts)), len(discounts), item_population)
+            assert abs(share - expected) <= 0.05 + margin, "Discount distribution deviates more than expected"
+    return observed
+
+
+class SampledValidation:
+    """
+    Reservoir samples of order summaries, line items and reviews, fed once for in-memory data
+    or chunk by chunk while streaming, then checked with confidence bounds in one pass.
+    """
+
+    def __init__(self, sample_size: int = DEFAULT_VALIDATION_SAMPLE_SIZE, seed: int = RANDOM_SEED):
+        rng = np.random.default_rng(seed)
+        self.orders = Reservoir(sample_size, rng)
+        self.discounts = Reservoir(sample_size, rng)
+        self.reviews = Reservoir(sample_size, rng)
+
+    def offer(
+        self,
+        products: pd.DataFrame,
+        orders: pd.DataFrame,
+        order_items: pd.DataFrame,
+        reviews: pd.DataFrame,
+        whale_ids: set[int],
+    ) -> None:
+        self.orders.offer(order_summaries(orders, order_items, products, whale_ids))
+        self.discounts.offer(order_items[["discount"]])
+        self.reviews.offer(reviews[["customer_id", "product_id"]])
+
+    def check(self, products: pd.DataFrame, customers: pd.DataFrame, skew: SkewProfile = DEFAULT_SKEW) -> None:
+        order_sample = self.orders.frame()
+        check_references(customers, products, order_sample, self.reviews.frame())
+        observed = check_revenue_shape(
+            order_sample,
+            self.discounts.frame()["discount"].to_numpy(),
+            skew,
+            VALIDATION_CONFIDENCE_Z,
+            self.orders.seen,
+            self.discounts.seen,
+        )
+        print(
+            f"  sampled {len(order_sample):,} of {self.orders.seen:,} orders and "
+            f"{len(self.discounts.frame()):,} of {self.discounts.seen:,} order items"
+        )
+        if "whale_revenue_share" in observed:
+            print(
+                f"  whale revenue share {observed['whale_revenue_share']:.2%} "
+                f"± {observed['whale_revenue_share_margin']:.2%} (z={VALIDATION_CONFIDENCE_Z})"
+            )
+
+
 def validate_datasets(
     products: pd.DataFrame,
     customers: pd.DataFrame,
@@ -499,110 +1243,1160 @@ def validate_datasets(
     order_items: pd.DataFrame,
     reviews: pd.DataFrame,
     whale_ids: set[int],
+    config: GenerationConfig = CONFIG,
+    skew: SkewProfile = DEFAULT_SKEW,
+    mode: str = "full",
+    sample_size: int = DEFAULT_VALIDATION_SAMPLE_SIZE,
 ) -> None:
-    """Perform basic referential and business rule validations."""
-    assert len(products) == CONFIG.products, "Unexpected product count"
-    assert len(customers) == CONFIG.customers, "Unexpected customer count"
-    assert len(orders) == CONFIG.orders, "Unexpected order count"
-    assert len(order_items) == CONFIG.order_items, "Unexpected order item count"
-    assert len(reviews) == CONFIG.reviews, "Unexpected review count"
-
-    # Referential integrity
-    assert orders["customer_id"].isin(customers["customer_id"]).all(), "Order references unknown customer"
-    assert order_items["order_id"].isin(orders["order_id"]).all(), "Order item references unknown order"
-    assert order_items["product_id"].isin(products["product_id"]).all(), "Order item references unknown product"
-    assert reviews["customer_id"].isin(customers["customer_id"]).all(), "Review references unknown customer"
-    assert reviews["product_id"].isin(products["product_id"]).all(), "Review references unknown product"
-
-    # Order date >= registration date
-    merged = orders.merge(customers[["customer_id", "registration_date"]], on="customer_id", how="left")
-    assert (merged["order_date"] >= merged["registration_date"]).all(), "Order predates customer registration"
+    """
+    Perform basic referential and business rule validations against the active config.
+    Revenue-shape checks are skipped when the skew profile deliberately reshapes that side.
+    "full" checks every row; "sample" checks row-level rules and statistics on reservoir
+    samples with confidence bounds; "off" skips validation.
+    """
+    if mode == "off":
+        return
+    assert len(products) == config.products, "Unexpected product count"
+    assert len(customers) == config.customers, "Unexpected customer count"
+    assert len(orders) == config.orders, "Unexpected order count"
+    assert len(order_items) == config.order_items, "Unexpected order item count"
+    assert len(reviews) == config.reviews, "Unexpected review count"
 
     # Profit margin checks
     margins = (products["price"] - products["cost"]) / products["price"]
     assert margins.between(0.20, 0.50).all(), "Product margin outside expected range"
 
-    # Revenue concentration
-    revenue_by_order = order_items.groupby("order_id")["line_total"].sum()
-    revenue_per_order = revenue_by_order.reindex(orders["order_id"], fill_value=0.0)
-    orders_with_revenue = orders.assign(_total=revenue_per_order.values)
-    whale_revenue = orders_with_revenue.loc[orders_with_revenue["customer_id"].isin(whale_ids), "_total"].sum()
-    total_revenue = orders_with_revenue["_total"].sum()
-    if total_revenue > 0:
+    if mode == "sample":
+        validation = SampledValidation(sample_size)
+        validation.offer(products, orders, order_items, reviews, whale_ids)
+        validation.check(products, customers, skew)
+        return
+
+    check_references(customers, products, orders, reviews)
+    check_revenue_shape(
+        order_summaries(orders, order_items, products, whale_ids),
+        order_items["discount"].to_numpy(),
+        skew,
+    )
+
+
+# -----------------------------
+# Orchestration
+# -----------------------------
+
+def import_zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError("zstd-compressed CSV output requires zstandard: pip install zstandard") from exc
+    return zstandard
+
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError("Parquet/Arrow output requires pyarrow: pip install pyarrow") from exc
+    return pyarrow
+
+
+class TableWriter:
+    """
+    Writes generated frames to one file per table in `output_dir`, appending when the same
+    table is written again (e.g. streaming chunks).
+
+    CSV goes through pandas into a plain, gzip or zstd stream that stays open across chunks,
+    so compressed output is produced incrementally. Parquet and Arrow go through pyarrow with compression and
+    dictionary encoding for the low-cardinality DICTIONARY_COLUMNS; Parquet row groups (and
+    Arrow record batches) hold `row_group_size` rows so readers can skip and project columns
+    cheaply. Streamed chunks are buffered until a full group is ready, so every group but a
+    table's last is full size whatever the chunk size.
+
+    The sqlite format skips files entirely: tables go straight into a fresh `ecommerce.db`
+    built from `schema_file`, one bulk executemany transaction per written frame.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        output_format: str = "csv",
+        compression: Optional[str] = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression_level: Optional[int] = None,
+        schema_file: Path = DEFAULT_SCHEMA_FILE,
+    ):
+        if output_format not in OUTPUT_COMPRESSIONS:
+            raise ValueError(f"Unknown output format {output_format!r}; expected one of {sorted(OUTPUT_COMPRESSIONS)}")
+        compression = compression or OUTPUT_COMPRESSIONS[output_format][0]
+        if compression not in OUTPUT_COMPRESSIONS[output_format]:
+            raise ValueError(
+                f"{output_format} output supports compression {OUTPUT_COMPRESSIONS[output_format]}, got {compression!r}"
+            )
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.compression_level = compression_level
+        self.schema_file = schema_file
+        self._connection: Optional[sqlite3.Connection] = None
+        self._writers: Dict[str, object] = {}
+        self._schemas: Dict[str, object] = {}
+        self._dictionaries: Dict[Tuple[str, str], pd.Index] = {}
+        self._pending: Dict[str, List[object]] = {}
+        self._pending_rows: Dict[str, int] = {}
+        self.paths_written: set[Path] = set()
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def path(self, name: str) -> Path:
+        if self.output_format == "sqlite":
+            return self.output_dir / SQLITE_DATABASE_NAME
+        if self.output_format == "csv":
+            return self.output_dir / f"{name}.csv{CSV_COMPRESSION_SUFFIXES[self.compression]}"
+        return self.output_dir / f"{name}.{self.output_format}"
+
+    def write(self, name: str, frame: pd.DataFrame) -> None:
+        self.paths_written.add(self.path(name))
+        if self.output_format == "csv":
+            first_write = name not in self._writers
+            if first_write:
+                self._writers[name] = self._open_csv(name)
+            frame.to_csv(self._writers[name], index=False, header=first_write)
+            return
+        if self.output_format == "sqlite":
+            self._insert_sqlite(name, frame)
+            return
+
+        table = self._to_arrow(name, frame)
+        if name not in self._writers:
+            self._schemas[name] = table.schema
+            self._writers[name] = self._open(name, table.schema)
+        self._pending.setdefault(name, []).append(table)
+        self._pending_rows[name] = self._pending_rows.get(name, 0) + table.num_rows
+        if self._pending_rows[name] >= self.row_group_size:
+            self._flush(name)
+
+    def close(self) -> None:
+        for name in list(self._pending):
+            self._flush(name, final=True)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        if self._connection is not None:
+            self._connection.execute("ANALYZE")
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    def _flush(self, name: str, final: bool = False) -> None:
+        """Write the buffered rows of `name` in whole row groups, keeping any partial group unless `final`."""
+        pa = import_pyarrow()
+        tables = self._pending.pop(name, [])
+        if not tables:
+            return
+        # Combining chunks also unifies the per-chunk dictionaries of Arrow dictionary columns
+        table = pa.concat_tables(tables).combine_chunks()
+        full_rows = table.num_rows if final else table.num_rows - table.num_rows % self.row_group_size
+        if full_rows:
+            if self.output_format == "parquet":
+                self._writers[name].write_table(table.slice(0, full_rows), row_group_size=self.row_group_size)
+            else:
+                self._writers[name].write_table(table.slice(0, full_rows), max_chunksize=self.row_group_size)
+        remainder = table.slice(full_rows)
+        self._pending_rows[name] = remainder.num_rows
+        if remainder.num_rows:
+            self._pending[name] = [remainder]
+
+    def _insert_sqlite(self, name: str, frame: pd.DataFrame) -> None:
+        if self._connection is None:
+            self._connection = self._open_sqlite()
+        date_columns = [column for column in frame.columns if column in DATE_COLUMNS]
+        if date_columns:
+            frame = frame.assign(
+                **{column: pd.to_datetime(frame[column]).dt.strftime("%Y-%m-%d") for column in date_columns}
+            )
+        columns = ", ".join(frame.columns)
+        placeholders = ", ".join("?" for _ in frame.columns)
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT INTO {name} ({columns}) VALUES ({placeholders})",
+                frame.itertuples(index=False, name=None),
+            )
+
+    def _open_sqlite(self) -> sqlite3.Connection:
+        db_path = self.path("")
+        if db_path.exists():
+            db_path.unlink()
+        connection = sqlite3.connect(db_path)
+        # Throwaway bulk load: trade durability for speed, the file is rebuilt on every run
+        connection.execute("PRAGMA journal_mode = MEMORY")
+        connection.execute("PRAGMA synchronous = OFF")
+        # Statistics are gathered once on close, after the data is in
+        connection.executescript(self.schema_file.read_text(encoding="utf-8").replace("ANALYZE;", ""))
+        return connection
+
+    def _open_csv(self, name: str):
+        path = self.path(name)
+        if self.compression == "gzip":
+            level = 6 if self.compression_level is None else self.compression_level
+            return gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=level)
+        if self.compression == "zstd":
+            level = 3 if self.compression_level is None else self.compression_level
+            compressor = import_zstandard().ZstdCompressor(level=level)
+            return io.TextIOWrapper(compressor.stream_writer(open(path, "wb")), encoding="utf-8", newline="")
+        return open(path, "w", encoding="utf-8", newline="")
+
+    def _open(self, name: str, schema):
+        pa = import_pyarrow()
+        codec = None if self.compression == "none" else self.compression
+        if self.output_format == "parquet":
+            import pyarrow.parquet as pq
+
+            dictionary_columns = [column for column in schema.names if column in DICTIONARY_COLUMNS]
+            return pq.ParquetWriter(
+                self.path(name),
+                schema,
+                compression=codec,
+                compression_level=self.compression_level if codec is not None else None,
+                use_dictionary=dictionary_columns,
+            )
+
+        import pyarrow.ipc as ipc
+
+        if codec is not None and self.compression_level is not None:
+            codec = pa.Codec(codec, compression_level=self.compression_level)
+        # Dictionaries grow chunk by chunk, which the IPC file format accepts as deltas
+        options = ipc.IpcWriteOptions(compression=codec, emit_dictionary_deltas=True)
+        return ipc.new_file(self.path(name), schema, options=options)
+
+    def _to_arrow(self, name: str, frame: pd.DataFrame):
+        pa = import_pyarrow()
+        schema = self._schemas.get(name)
+        columns = {}
+        for column in frame.columns:
+            values = frame[column]
+            if self.output_format == "arrow" and column in DICTIONARY_COLUMNS:
+                columns[column] = self._dictionary_array(name, column, values)
+            elif isinstance(values.dtype, pd.CategoricalDtype):
+                # In-memory categories vary per chunk; files store plain strings (dictionary-encoded by Parquet)
+                columns[column] = pa.array(values, from_pandas=True).dictionary_decode()
+            elif column in DATE_COLUMNS:
+                columns[column] = pa.array(values, from_pandas=True).cast(pa.date32())
+            else:
+                field_type = schema.field(column).type if schema is not None else None
+                columns[column] = pa.array(values, type=field_type, from_pandas=True)
+        return pa.table(columns)
+
+    def _dictionary_array(self, name: str, column: str, values: pd.Series):
+        """Encode against a per-column vocabulary that only ever appends, so earlier batches stay valid."""
+        pa = import_pyarrow()
+        key = (name, column)
+        vocabulary = self._dictionaries.get(key, pd.Index([], dtype=object))
+        uniques = pd.Index(values.astype(object).unique())
+        vocabulary = vocabulary.append(uniques[~uniques.isin(vocabulary)])
+        self._dictionaries[key] = vocabulary
+        indices = pa.array(vocabulary.get_indexer(values.astype(object)), type=pa.int32())
+        return pa.DictionaryArray.from_arrays(indices, pa.array(vocabulary.to_numpy(dtype=object), type=pa.string()))
+
+
+def export_frames(writer: TableWriter, frames: Dict[str, pd.DataFrame]) -> None:
+    for name, frame in frames.items():
+        writer.write(name, frame)
+
+
+def generate_streaming(
+    faker: Faker,
+    products: pd.DataFrame,
+    customers: pd.DataFrame,
+    config: GenerationConfig,
+    whale_ids: set[int],
+    writer: TableWriter,
+    chunk_size: int,
+    pools: Optional[FakerPools] = None,
+    skew: SkewProfile = DEFAULT_SKEW,
+    validation: Optional[SampledValidation] = None,
+    profiler: Optional[RunProfiler] = None,
+) -> None:
+    """
+    Generate orders, order items and reviews in chunks of `chunk_size` orders and append each
+    chunk to the output files as soon as it is ready, so peak memory follows the chunk size.
+    Line items and reviews are split across chunks in proportion to the orders they cover.
+    Each chunk is offered to `validation` (when given) before it is dropped.
+    """
+    if profiler is None:
+        profiler = RunProfiler()
+    customer_sampler = build_customer_sampler(customers, whale_ids, skew)
+    product_samplers = build_product_samplers(products, skew)
+
+    order_bounds = list(range(0, config.orders, chunk_size)) + [config.orders]
+    chunk_count = len(order_bounds) - 1
+    items_written = reviews_written = 0
+    whale_revenue = total_revenue = 0.0
+    for chunk_index, (start, end) in enumerate(zip(order_bounds, order_bounds[1:])):
+        items_end = config.order_items * end // config.orders
+        reviews_end = config.reviews * items_end // config.order_items
+        chunk_config = replace(
+            config,
+            orders=end - start,
+            order_items=items_end - items_written,
+            reviews=reviews_end - reviews_written,
+        )
+        print(f"  chunk {chunk_index + 1}/{chunk_count}: orders {start + 1:,}-{end:,}")
+
+        with profiler.stage("orders") as stage:
+            orders = generate_orders(
+                faker, customers, chunk_config, whale_ids, pools, start + 1, customer_sampler, skew
+            )
+            stage.rows += len(orders)
+        with profiler.stage("order_items") as stage:
+            order_items = generate_order_items(
+                orders, products, chunk_config, whale_ids, items_written + 1, product_samplers
+            )
+            stage.rows += len(order_items)
+        with profiler.stage("reviews") as stage:
+            reviews = generate_reviews(orders, order_items, products, chunk_config, reviews_written + 1)
+            stage.rows += len(reviews)
+        with profiler.stage("export") as stage:
+            export_frames(writer, {"orders": orders, "order_items": order_items, "reviews": reviews})
+            stage.rows += len(orders) + len(order_items) + len(reviews)
+        if validation is not None:
+            with profiler.stage("validation") as stage:
+                validation.offer(products, orders, order_items, reviews, whale_ids)
+                stage.rows += len(orders) + len(order_items) + len(reviews)
+
+        items_written = items_end
+        reviews_written = reviews_end
+        whale_revenue += orders.loc[orders["customer_id"].isin(whale_ids), "total_amount"].sum()
+        total_revenue += orders["total_amount"].sum()
+
+    assert items_written == config.order_items, "Unexpected order item count"
+    assert reviews_written == config.reviews, "Unexpected review count"
+    if (
+        validation is not None
+        and total_revenue > 0
+        and skew.keeps_customer_shape
+        and config.orders >= MIN_SHAPE_CHECK_ROWS
+    ):
         whale_share = whale_revenue / total_revenue
         assert whale_share >= WHALe_REVENUE_TARGET - 0.02, f"Whale revenue share too low: {whale_share:.2%}"
 
-    # Electronics order value check
-    order_has_electronics = order_items.merge(
-        products[["product_id", "category"]],
-        on="product_id",
-        how="left",
-        validate="many_to_one",
+
+def change_event_lines(event_type: str, event_times: np.ndarray, payload: pd.DataFrame) -> List[str]:
+    """Serialise one event type's rows as JSON lines carrying event_time and event_type first."""
+    frame = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "event_time": np.datetime_as_string(event_times, unit="s"),
+                    "event_type": event_type,
+                }
+            ),
+            payload.reset_index(drop=True),
+        ],
+        axis=1,
     )
-    electronics_orders = order_has_electronics.loc[order_has_electronics["category"] == "Electronics", "order_id"].unique()
-    non_electronics_orders = set(orders["order_id"]) - set(electronics_orders)
+    if frame.empty:
+        return []
+    return frame.to_json(orient="records", lines=True).splitlines()
 
-    electronics_avg = orders.loc[orders["order_id"].isin(electronics_orders), "total_amount"].mean()
-    other_avg = orders.loc[orders["order_id"].isin(non_electronics_orders), "total_amount"].mean()
-    if not math.isnan(electronics_avg) and not math.isnan(other_avg):
-        assert electronics_avg >= other_avg, "Electronics orders should have higher average value"
 
-    # Discount distribution sanity check
-    discount_counts = order_items["discount"].value_counts(normalize=True)
-    for discount, expected in zip(DISCOUNT_OPTIONS, DISCOUNT_WEIGHTS):
-        observed = discount_counts.get(discount, 0)
-        assert abs(observed - expected) <= 0.05, "Discount distribution deviates more than expected"
+def write_change_log(
+    path: Path,
+    orders: pd.DataFrame,
+    order_items: pd.DataFrame,
+    reviews: pd.DataFrame,
+) -> int:
+    """
+    Write a timestamp-ordered JSONL change log replaying how the dataset came to be:
+    order_created (status Processing), line_item_added, status_changed and review_posted.
 
+    Orders are created at a random second of their order_date and their lines follow within
+    minutes. Completed orders close 1-7 days later, cancellations land within 1-48 hours,
+    and returns are completed first and returned 7-30 days after that.
+    """
+    seconds = np.timedelta64(1, "s")
+    hour, day = 3_600, 86_400
+    created_at = np.asarray(orders["order_date"].to_numpy(), dtype="datetime64[D]").astype("datetime64[s]")
+    created_at = created_at + np.random.randint(0, day, size=len(orders)) * seconds
+    shipping_columns = ["shipping_address", "shipping_city", "shipping_state", "shipping_zip", "shipping_country"]
+    events: List[Tuple[np.ndarray, List[str]]] = [
+        (
+            created_at,
+            change_event_lines(
+                "order_created",
+                created_at,
+                orders[["order_id", "customer_id", "payment_method", *shipping_columns]].assign(
+                    order_date=orders["order_date"].astype(str),
+                    status="Processing",
+                    total_amount=0.0,
+                ),
+            ),
+        )
+    ]
 
-# -----------------------------
-# Orchestration
-# -----------------------------
+    # Line items trickle in a couple of minutes apart right after their order is created
+    item_order_positions = pd.Index(orders["order_id"]).get_indexer(order_items["order_id"])
+    item_gaps = pd.Series(np.random.randint(1, 121, size=len(order_items)))
+    item_offsets = item_gaps.groupby(order_items["order_id"].to_numpy()).cumsum().to_numpy()
+    item_added_at = created_at[item_order_positions] + item_offsets * seconds
+    item_columns = ["order_item_id", "order_id", "product_id", "quantity", "unit_price", "discount", "line_total"]
+    events.append((item_added_at, change_event_lines("line_item_added", item_added_at, order_items[item_columns])))
+
+    final_status = orders["status"].to_numpy()
+    completed = np.isin(final_status, ["Completed", "Returned"])
+    completed_at = created_at + np.random.randint(day, 7 * day + 1, size=len(orders)) * seconds
+    transitions = [
+        (completed, completed_at, "Processing", "Completed"),
+        (
+            final_status == "Cancelled",
+            created_at + np.random.randint(hour, 48 * hour + 1, size=len(orders)) * seconds,
+            "Processing",
+            "Cancelled",
+        ),
+        (
+            final_status == "Returned",
+            completed_at + np.random.randint(7 * day, 30 * day + 1, size=len(orders)) * seconds,
+            "Completed",
+            "Returned",
+        ),
+    ]
+    for mask, changed_at, old_status, new_status in transitions:
+        payload = pd.DataFrame(
+            {"order_id": orders["order_id"].to_numpy()[mask], "old_status": old_status, "new_status": new_status}
+        )
+        events.append((changed_at[mask], change_event_lines("status_changed", changed_at[mask], payload)))
+
+    posted_at = np.asarray(reviews["review_date"].to_numpy(), dtype="datetime64[D]").astype("datetime64[s]")
+    posted_at = posted_at + np.random.randint(0, day, size=len(reviews)) * seconds
+    events.append(
+        (
+            posted_at,
+            change_event_lines(
+                "review_posted",
+                posted_at,
+                reviews[["review_id", "product_id", "customer_id", "rating", "review_text"]].assign(
+                    review_date=reviews["review_date"].astype(str)
+                ),
+            ),
+        )
+    )
 
-def export_frames(output_dir: Path, frames: Dict[str, pd.DataFrame]) -> None:
-    for name, frame in frames.items():
-        frame.to_csv(output_dir / f"{name}.csv", index=False)
+    event_times = np.concatenate([times for times, _ in events])
+    lines = [line for _, type_lines in events for line in type_lines]
+    order = np.argsort(event_times, kind="stable")
+    with path.open("w", encoding="utf-8") as change_log:
+        for event_id, position in enumerate(order, start=1):
+            change_log.write(f'{{"event_id":{event_id},{lines[position][1:]}\n')
+    return len(lines)
+
+
+def read_generated_table(directory: Path, name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a table written by TableWriter in any file format (csv, csv.gz/.zst, parquet, arrow)."""
+    for suffix in CSV_COMPRESSION_SUFFIXES.values():
+        path = directory / f"{name}.csv{suffix}"
+        if path.exists():
+            return pd.read_csv(path, usecols=columns, dtype=CSV_TEXT_COLUMNS)
+    path = directory / f"{name}.parquet"
+    if path.exists():
+        return pd.read_parquet(path, columns=columns)
+    path = directory / f"{name}.arrow"
+    if path.exists():
+        import_pyarrow()
+        import pyarrow.ipc as ipc
+
+        table = ipc.open_file(path).read_all()
+        return (table.select(columns) if columns else table).to_pandas()
+    raise FileNotFoundError(f"No generated {name} table found in {directory}")
+
+
+@dataclass
+class DatasetState:
+    """Everything an incremental run needs to continue an existing dataset."""
+
+    products: pd.DataFrame
+    customers: pd.DataFrame
+    whale_ids: set[int]
+    next_order_id: int
+    next_item_id: int
+    next_review_id: int
+    last_day: date
+    orders_per_day: float
+    customers_per_day: float
+    items_per_order: float
+    reviews_per_item: float
+
+
+def daily_partition_dirs(output_dir: Path) -> List[Path]:
+    daily_dir = output_dir / DAILY_PARTITION_DIR
+    if not daily_dir.exists():
+        return []
+    return sorted(path for path in daily_dir.iterdir() if path.is_dir())
+
+
+def load_dataset_state(output_dir: Path) -> DatasetState:
+    """
+    Read the base dataset plus any daily partitions already appended to it. Whales are
+    re-identified as the top WHALe_SHARE of customers by historical revenue, and the daily
+    arrival rates are averaged over the observed order and registration date ranges. The
+    dataset resumes after its newest daily partition, even one without orders, or else
+    after its last order date.
+    """
+    directories = [output_dir] + daily_partition_dirs(output_dir)
+
+    def read_all(name: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        tables = [read_generated_table(directory, name, columns) for directory in directories]
+        # A quiet day's header-only CSV reads back as object columns; leave it out so dtypes survive
+        return pd.concat([table for table in tables if len(table)] or tables[:1], ignore_index=True)
+
+    products = compact_frame(read_generated_table(output_dir, "products"))
+    customers = compact_frame(read_all("customers"))
+    orders = read_all("orders", ["order_id", "customer_id", "order_date", "total_amount"])
+    order_dates = pd.to_datetime(orders["order_date"])
+    item_ids = read_all("order_items", ["order_item_id"])["order_item_id"]
+    review_ids = read_all("reviews", ["review_id"])["review_id"]
+    registration_dates = pd.to_datetime(customers["registration_date"])
+
+    revenue = orders.groupby("customer_id")["total_amount"].sum().reindex(customers["customer_id"], fill_value=0.0)
+    whale_count = int(len(customers) * WHALe_SHARE)
+    whale_ids = set(revenue.nlargest(whale_count).index.tolist())
+
+    order_days = max((order_dates.max() - order_dates.min()).days + 1, 1)
+    registration_days = max((registration_dates.max() - registration_dates.min()).days + 1, 1)
+    return DatasetState(
+        products=products,
+        customers=customers,
+        whale_ids=whale_ids,
+        next_order_id=int(orders["order_id"].max()) + 1,
+        next_item_id=int(item_ids.max()) + 1,
+        next_review_id=int(review_ids.max()) + 1 if len(review_ids) else 1,
+        last_day=max(
+            [order_dates.max().date()] + [date.fromisoformat(path.name) for path in directories[1:]]
+        ),
+        orders_per_day=len(orders) / order_days,
+        customers_per_day=len(customers) / registration_days,
+        items_per_order=len(item_ids) / len(orders),
+        reviews_per_item=len(review_ids) / len(item_ids),
+    )
 
 
-def main(output_dir: Path) -> None:
-    set_random_seed()
-    ensure_output_dir(output_dir)
+def generate_daily_feed(
+    faker: Faker,
+    output_dir: Path,
+    days: int,
+    make_writer: Callable[[Path], TableWriter],
+    pools: Optional[FakerPools] = None,
+    skew: SkewProfile = DEFAULT_SKEW,
+    profiler: Optional[RunProfiler] = None,
+) -> None:
+    """
+    Continue the dataset in `output_dir` by `days` days after its last day. Each day
+    gets Poisson-sized batches of new customers and orders (scaled by that month's seasonal
+    weight), with item and review volumes following the dataset's historical ratios, and is
+    written as its own partition under `daily/<YYYY-MM-DD>/`.
+    """
+    if profiler is None:
+        profiler = RunProfiler()
+    with profiler.stage("load_state") as stage:
+        state = load_dataset_state(output_dir)
+        stage.rows += len(state.customers)
+    # Reseed from the continuation point so successive appends draw fresh, reproducible streams
+    feed_seed = RANDOM_SEED + state.last_day.toordinal()
+    set_random_seed(feed_seed)
+    Faker.seed(feed_seed)
+    print(
+        f"Continuing from {state.last_day} (next order_id {state.next_order_id:,}, "
+        f"{len(state.customers):,} customers, {len(state.whale_ids):,} whales)"
+    )
+    product_samplers = build_product_samplers(state.products, skew)
+    unique_emails = set(state.customers["email"])
+    email_suffixes = email_suffix_counters(unique_emails)
+    mean_month_weight = float(np.mean(list(SEASONAL_MONTH_WEIGHTS.values())))
+    feed_days = [state.last_day + timedelta(days=offset) for offset in range(1, days + 1)]
+    existing = [day for day in feed_days if (output_dir / DAILY_PARTITION_DIR / day.isoformat()).exists()]
+    if existing:
+        raise FileExistsError(f"Daily partition {existing[0]} already exists under {output_dir / DAILY_PARTITION_DIR}")
+
+    for day in feed_days:
+        seasonal_factor = SEASONAL_MONTH_WEIGHTS[day.month] / mean_month_weight if skew.seasonal else 1.0
+        seasonal_factor *= skew.day_multiplier(day)
+
+        new_customer_count = int(np.random.poisson(state.customers_per_day))
+        with profiler.stage("customers") as stage:
+            new_customers = generate_customers(
+                faker,
+                replace(CONFIG, customers=new_customer_count, orders=0, order_items=0, reviews=0),
+                pools,
+                int(state.customers["customer_id"].max()) + 1,
+                unique_emails,
+                email_suffixes,
+            )
+            new_customers["registration_date"] = np.datetime64(day, "s")
+            new_whales = set(new_customers["customer_id"].sample(frac=WHALe_SHARE).tolist())
+            state.customers = pd.concat([state.customers, new_customers], ignore_index=True)
+            state.whale_ids |= new_whales
+            stage.rows += new_customer_count
+
+        order_count = int(np.random.poisson(state.orders_per_day * seasonal_factor))
+        item_count = min(max(round(order_count * state.items_per_order), order_count), 5 * order_count)
+        review_count = min(round(item_count * state.reviews_per_item), item_count)
+        day_config = replace(
+            CONFIG,
+            customers=len(state.customers),
+            orders=order_count,
+            order_items=item_count,
+            reviews=review_count,
+        )
+
+        with profiler.stage("orders") as stage:
+            orders = generate_orders(
+                faker, state.customers, day_config, state.whale_ids, pools, state.next_order_id, skew=skew
+            )
+            orders["order_date"] = np.datetime64(day, "s")
+            stage.rows += order_count
+        with profiler.stage("order_items") as stage:
+            order_items = generate_order_items(
+                orders, state.products, day_config, state.whale_ids, state.next_item_id, product_samplers, skew
+            )
+            stage.rows += item_count
+        with profiler.stage("reviews") as stage:
+            reviews = generate_reviews(orders, order_items, state.products, day_config, state.next_review_id, day)
+            stage.rows += review_count
+
+        partition_dir = output_dir / DAILY_PARTITION_DIR / day.isoformat()
+        ensure_output_dir(partition_dir)
+        with profiler.stage("export") as stage, make_writer(partition_dir) as writer:
+            export_frames(
+                writer,
+                {"customers": new_customers, "orders": orders, "order_items": order_items, "reviews": reviews},
+            )
+            stage.rows += new_customer_count + order_count + item_count + review_count
+        print(
+            f"  {day}: {new_customer_count:,} customers, {order_count:,} orders, "
+            f"{item_count:,} order items, {review_count:,} reviews"
+        )
+
+        state.next_order_id += order_count
+        state.next_item_id += item_count
+        state.next_review_id += review_count
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """One shard's slice of the id space, its local row targets and its random seed."""
+
+    seed: int
+    config: GenerationConfig
+    first_customer_id: int
+    first_order_id: int
+    first_item_id: int
+    first_review_id: int
+
+
+def plan_shards(config: GenerationConfig, workers: int, seed: int = RANDOM_SEED) -> List[ShardSpec]:
+    """
+    Split customer and order id ranges evenly into `workers` shards; items and reviews follow
+    their orders proportionally. Seeds are spawned from `seed`, so a given seed and worker
+    count always yields the same shards.
+    """
+    if workers > config.customers:
+        raise ValueError(f"Cannot split {config.customers:,} customers across {workers} workers")
+
+    def bounds(total: int) -> List[int]:
+        return [total * shard // workers for shard in range(workers + 1)]
+
+    customer_bounds = bounds(config.customers)
+    order_bounds = bounds(config.orders)
+    item_bounds = [config.order_items * end // config.orders if config.orders else 0 for end in order_bounds]
+    review_bounds = [config.reviews * end // config.order_items if config.order_items else 0 for end in item_bounds]
+    shard_seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(workers)]
+
+    return [
+        ShardSpec(
+            seed=shard_seeds[shard],
+            config=replace(
+                config,
+                customers=customer_bounds[shard + 1] - customer_bounds[shard],
+                orders=order_bounds[shard + 1] - order_bounds[shard],
+                order_items=item_bounds[shard + 1] - item_bounds[shard],
+                reviews=review_bounds[shard + 1] - review_bounds[shard],
+            ),
+            first_customer_id=customer_bounds[shard] + 1,
+            first_order_id=order_bounds[shard] + 1,
+            first_item_id=item_bounds[shard] + 1,
+            first_review_id=review_bounds[shard] + 1,
+        )
+        for shard in range(workers)
+    ]
+
+
+def generate_shard(
+    spec: ShardSpec,
+    products: pd.DataFrame,
+    faker_pool_size: int = 0,
+    skew: SkewProfile = DEFAULT_SKEW,
+) -> Tuple[Dict[str, pd.DataFrame], set[int]]:
+    """Generate one shard's customers, orders, items and reviews from its own random stream."""
+    set_random_seed(spec.seed)
     faker = Faker("en_US")
-    Faker.seed(RANDOM_SEED)
+    Faker.seed(spec.seed)
+    pools = build_faker_pools(faker, faker_pool_size) if faker_pool_size > 0 else None
 
-    print("Generating products...")
-    products = generate_products(faker, CONFIG)
+    customers = generate_customers(faker, spec.config, pools, spec.first_customer_id)
+    whale_ids = select_whale_ids(customers)
+    orders = generate_orders(faker, customers, spec.config, whale_ids, pools, spec.first_order_id, skew=skew)
+    order_items = generate_order_items(orders, products, spec.config, whale_ids, spec.first_item_id, skew=skew)
+    reviews = generate_reviews(orders, order_items, products, spec.config, spec.first_review_id)
+    frames = {"customers": customers, "orders": orders, "order_items": order_items, "reviews": reviews}
+    return frames, whale_ids
 
-    print("Generating customers...")
-    customers = generate_customers(faker, CONFIG)
 
-    whale_count = int(CONFIG.customers * WHALe_SHARE)
-    whale_ids = set(random.sample(list(customers["customer_id"]), whale_count))
+def generate_sharded(
+    products: pd.DataFrame,
+    config: GenerationConfig,
+    workers: int,
+    faker_pool_size: int = 0,
+    skew: SkewProfile = DEFAULT_SKEW,
+) -> Tuple[Dict[str, pd.DataFrame], set[int]]:
+    """
+    Generate customers, orders, items and reviews as `workers` shards in a process pool and
+    concatenate them in shard order. Emails are re-suffixed where shards picked the same one.
+    """
+    specs = plan_shards(config, workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(generate_shard, specs, [products] * workers, [faker_pool_size] * workers, [skew] * workers)
+        )
 
-    print("Generating orders...")
-    orders = generate_orders(faker, customers, CONFIG, whale_ids)
+    # Shards infer different categories for open-vocabulary columns, so re-compact after concatenating
+    frames = {
+        name: compact_frame(pd.concat([shard_frames[name] for shard_frames, _ in results], ignore_index=True))
+        for name in ("customers", "orders", "order_items", "reviews")
+    }
+    frames["customers"]["email"] = deduplicate_emails(frames["customers"]["email"].tolist())
+    whale_ids = set().union(*(shard_whales for _, shard_whales in results))
+    return frames, whale_ids
 
-    print("Generating order items...")
-    order_items = generate_order_items(orders, products, CONFIG, whale_ids)
 
-    print("Generating reviews...")
-    reviews = generate_reviews(orders, order_items, products, CONFIG)
+def skew_description(skew: SkewProfile) -> Dict:
+    description = asdict(skew)
+    description["flash_sale_days"] = [day.isoformat() for day in skew.flash_sale_days]
+    return description
 
-    print("Running data validations...")
-    validate_datasets(products, customers, orders, order_items, reviews, whale_ids)
 
-    print(f"Exporting CSVs to {output_dir.resolve()} ...")
-    export_frames(
-        output_dir,
-        {
-            "products": products,
-            "customers": customers,
-            "orders": orders,
-            "order_items": order_items,
-            "reviews": reviews,
-        },
+def data_shape_summary(
+    products: pd.DataFrame,
+    customers: pd.DataFrame,
+    orders: pd.DataFrame,
+    order_items: pd.DataFrame,
+) -> Dict[str, float]:
+    """Observed hot-key concentration, so a manifest shows what a profile actually produced."""
+
+    def top_share(keys: pd.Series, top: int) -> float:
+        return float(keys.value_counts().head(max(1, top)).sum() / len(keys)) if len(keys) else 0.0
+
+    return {
+        "top_1pct_products_item_share": top_share(order_items["product_id"], math.ceil(len(products) * 0.01)),
+        "top_1pct_customers_order_share": top_share(orders["customer_id"], math.ceil(len(customers) * 0.01)),
+        "busiest_day_order_share": top_share(orders["order_date"], 1),
+    }
+
+
+def write_manifest(output_dir: Path, run: Dict, shape: Optional[Dict[str, float]] = None) -> None:
+    """
+    Record how the dataset was generated in manifest.json next to the output. Appends are
+    added to the existing manifest's "appends" list instead of replacing the base run.
+    """
+    path = output_dir / MANIFEST_NAME
+    if run.get("append_days"):
+        manifest = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        manifest.setdefault("appends", []).append(run)
+    else:
+        manifest = {**run, "data_shape": shape}
+    path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+@dataclass
+class StageStats:
+    """Accumulated cost of one generation stage, summed over chunks or days when it repeats."""
+
+    name: str
+    seconds: float = 0.0
+    rows: int = 0
+    calls: int = 0
+    peak_traced_bytes: Optional[int] = None  # only recorded while tracemalloc is tracing
+
+    def as_dict(self) -> Dict:
+        return {
+            "stage": self.name,
+            "seconds": round(self.seconds, 4),
+            "rows": self.rows,
+            "calls": self.calls,
+            "rows_per_second": round(self.rows / self.seconds, 1) if self.seconds > 0 else None,
+            "peak_traced_mb": None if self.peak_traced_bytes is None else round(self.peak_traced_bytes / 2**20, 2),
+        }
+
+
+class RunProfiler:
+    """
+    Wall time, rows/sec and (when tracing) tracemalloc peak memory per generation stage. The
+    peak is the highest traced allocation total reached while the stage ran, so it includes
+    data kept alive from earlier stages.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, StageStats] = {}
+        self.bytes_per_row: Dict[str, float] = {}
+        self.uncompacted_bytes_per_row: Dict[str, float] = {}
+        self.cache: Optional[Dict] = None
+        self.started = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        """Time the enclosed block into the named stage; callers add the rows they produced."""
+        stats = self.stages.setdefault(name, StageStats(name))
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.seconds += time.perf_counter() - start
+            stats.calls += 1
+            if self.trace_memory:
+                stats.peak_traced_bytes = max(stats.peak_traced_bytes or 0, tracemalloc.get_traced_memory()[1])
+
+    def close(self) -> None:
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def report(self, run: Dict) -> Dict:
+        return {
+            "run": run,
+            "code_version": generator_code_version(),
+            "environment": {**library_versions(), "platform": platform.platform()},
+            "trace_memory": self.trace_memory,
+            "total_seconds": round(time.perf_counter() - self.started, 4),
+            "stages": [stats.as_dict() for stats in self.stages.values()],
+            "bytes_per_row": {
+                name: {"uncompacted": round(self.uncompacted_bytes_per_row.get(name, 0.0), 1), "compact": round(size, 1)}
+                for name, size in self.bytes_per_row.items()
+            },
+            "cache": self.cache,
+        }
+
+    def print_summary(self) -> None:
+        print("Stage timings:")
+        for stats in self.stages.values():
+            rate = f"{stats.rows / stats.seconds:>12,.0f} rows/s" if stats.seconds > 0 and stats.rows else " " * 19
+            peak = f"  peak {stats.peak_traced_bytes / 2**20:,.1f} MB" if self.trace_memory else ""
+            print(f"  {stats.name:16s} {stats.seconds:8.2f}s {stats.rows:>12,} rows {rate}{peak}")
+
+
+def generator_code_version() -> str:
+    """Short content hash of this script, identifying the generator version in reports."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def library_versions() -> Dict[str, Optional[str]]:
+    """Python and library versions the generated values or output encoding depend on (None if absent)."""
+    versions: Dict[str, Optional[str]] = {"python": platform.python_version()}
+    for package in ("numpy", "pandas", "Faker", "pyarrow", "zstandard"):
+        try:
+            versions[package.lower()] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package.lower()] = None
+    return versions
+
+
+def cache_key(run: Dict, schema_file: Path) -> str:
+    """
+    Hash of everything that determines the output bytes: the run settings (config, seed, skew,
+    format and layout options), the generator code version, the Python and library versions
+    and, for SQLite, the schema. Validation settings are left out because they never change the output.
+    """
+    material = {name: value for name, value in run.items() if name != "validate"}
+    material["code_version"] = generator_code_version()
+    material["environment"] = library_versions()
+    if run["output_format"] == "sqlite":
+        material["schema"] = hashlib.sha256(schema_file.read_bytes()).hexdigest()
+    return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+
+
+class GenerationCache:
+    """
+    Content-addressed store of generated output files under `root/<key>/`. A hit copies the
+    files back instead of regenerating. Entries are staged in a temporary directory and
+    renamed into place, so an interrupted run never leaves a partial entry. Once the cache
+    exceeds `max_bytes`, the least recently used entries (by directory mtime, refreshed on
+    every hit) are evicted.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def restore(self, key: str, output_dir: Path) -> Optional[List[Path]]:
+        entry = self.root / key
+        if not entry.is_dir():
+            return None
+        restored = []
+        for cached in sorted(entry.iterdir()):
+            shutil.copy2(cached, output_dir / cached.name)
+            restored.append(output_dir / cached.name)
+        os.utime(entry)
+        return restored
+
+    def store(self, key: str, files: Sequence[Path]) -> bool:
+        """Copy `files` into the cache as entry `key`; returns False when they cannot fit."""
+        entry = self.root / key
+        if entry.exists():
+            os.utime(entry)
+            return True
+        if sum(path.stat().st_size for path in files) > self.max_bytes:
+            return False
+        ensure_output_dir(self.root)
+        staging = self.root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        for path in files:
+            shutil.copy2(path, staging / path.name)
+        try:
+            staging.rename(entry)
+        except OSError:
+            # Another run stored the same key first; its entry is identical
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict(keep=key)
+        return True
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        entries = [path for path in self.root.iterdir() if path.is_dir() and not path.name.startswith(".")]
+        sizes = {path: sum(file.stat().st_size for file in path.iterdir()) for path in entries}
+        total = sum(sizes.values())
+        evicted = []
+        for path in sorted(entries, key=lambda entry: entry.stat().st_mtime):
+            if total <= self.max_bytes:
+                break
+            if path.name == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= sizes[path]
+            evicted.append(path.name)
+        return evicted
+
+
+def main(
+    output_dir: Path,
+    faker_pool_size: int = 0,
+    chunk_size: int = 0,
+    workers: int = 1,
+    config: GenerationConfig = CONFIG,
+    output_format: str = "csv",
+    compression: Optional[str] = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression_level: Optional[int] = None,
+    schema_file: Path = DEFAULT_SCHEMA_FILE,
+    append_days: int = 0,
+    change_log: bool = False,
+    skew: SkewProfile = DEFAULT_SKEW,
+    time_ordered_ids: bool = False,
+    validate: str = "full",
+    validation_sample_size: int = DEFAULT_VALIDATION_SAMPLE_SIZE,
+    trace_memory: bool = False,
+    cache_dir: Optional[Path] = None,
+    cache_max_bytes: int = DEFAULT_CACHE_MAX_MB * 2**20,
+) -> None:
+    set_random_seed()
+    ensure_output_dir(output_dir)
+    profiler = RunProfiler(trace_memory)
+    writer = TableWriter(output_dir, output_format, compression, row_group_size, compression_level, schema_file)
+    faker = Faker("en_US")
+    Faker.seed(RANDOM_SEED)
+
+    print(
+        f"Target sizes: {config.products:,} products, {config.customers:,} customers, {config.orders:,} orders, "
+        f"{config.order_items:,} order items, {config.reviews:,} reviews"
     )
+    if skew != DEFAULT_SKEW:
+        print(f"Skew profile: {skew.name}")
+    run = {
+        "seed": RANDOM_SEED,
+        "config": asdict(config),
+        "skew_profile": skew_description(skew),
+        "output_format": output_format,
+        "compression": compression,
+        "compression_level": compression_level,
+        "row_group_size": row_group_size,
+        "workers": workers,
+        "chunk_size": chunk_size,
+        "faker_pool_size": faker_pool_size,
+        "append_days": append_days,
+        "time_ordered_ids": time_ordered_ids,
+        "change_log": change_log,
+        "validate": validate,
+    }
+    # Appends depend on the dataset already on disk, so only full generations are cached
+    cache = GenerationCache(cache_dir, cache_max_bytes) if cache_dir is not None and append_days == 0 else None
+    key = cache_key(run, schema_file) if cache is not None else None
+
+    def finish(shape: Optional[Dict[str, float]] = None, generated: bool = True) -> None:
+        if generated:
+            write_manifest(output_dir, run, shape)
+        if cache is not None and generated:
+            files = sorted(writer.paths_written) + [output_dir / MANIFEST_NAME]
+            if change_log:
+                files.append(output_dir / CHANGE_LOG_NAME)
+            with profiler.stage("cache_store") as stage:
+                stored = cache.store(key, files)
+                stage.rows += len(files)
+            profiler.cache = {"key": key, "hit": False, "stored": stored}
+            print(f"Cached output as {key}" if stored else "Output exceeds the cache size limit; not cached")
+        profiler.close()
+        report_path = output_dir / RUN_REPORT_NAME
+        report_path.write_text(json.dumps(profiler.report(run), indent=2) + "\n", encoding="utf-8")
+        profiler.print_summary()
+        print(f"Run report written to {report_path.resolve()}")
+        print("Generation complete [done]")
+
+    if cache is not None:
+        with profiler.stage("cache_restore") as stage:
+            restored = cache.restore(key, output_dir)
+            stage.rows += len(restored or [])
+        if restored is not None:
+            profiler.cache = {"key": key, "hit": True}
+            print(f"Cache hit {key}: restored {len(restored)} files from {cache_dir.resolve()}")
+            finish(generated=False)
+            return
+        print(f"Cache miss {key}; generating")
+
+    pools = None
+    if faker_pool_size > 0:
+        print(f"Building Faker value pools ({faker_pool_size:,} per field)...")
+        with profiler.stage("faker_pools") as stage:
+            pools = build_faker_pools(faker, faker_pool_size)
+            stage.rows += faker_pool_size * len(FAKER_FIELDS)
+
+    if append_days > 0:
+        print(f"Appending {append_days} daily partitions to {output_dir.resolve()} ...")
+        generate_daily_feed(
+            faker,
+            output_dir,
+            append_days,
+            lambda directory: TableWriter(
+                directory, output_format, compression, row_group_size, compression_level, schema_file
+            ),
+            pools,
+            skew,
+            profiler,
+        )
+        finish()
+        return
 
-    print("Generation complete [done]")
+    print("Generating products...")
+    with profiler.stage("products") as stage:
+        products = generate_products(faker, config, pools)
+        stage.rows += len(products)
+
+    if workers > 1:
+        print(f"Generating customers, orders, order items and reviews in {workers} shards...")
+        with profiler.stage("shards") as stage:
+            frames, whale_ids = generate_sharded(products, config, workers, faker_pool_size, skew)
+            stage.rows += sum(len(frame) for frame in frames.values())
+        customers = frames["customers"]
+        orders = frames["orders"]
+        order_items = frames["order_items"]
+        reviews = frames["reviews"]
+    else:
+        print("Generating customers...")
+        with profiler.stage("customers") as stage:
+            customers = generate_customers(faker, config, pools)
+            whale_ids = select_whale_ids(customers)
+            stage.rows += len(customers)
+
+        if chunk_size > 0:
+            print(f"Exporting products and customers to {output_dir.resolve()} ...")
+            with writer:
+                with profiler.stage("export") as stage:
+                    export_frames(writer, {"products": products, "customers": customers})
+                    stage.rows += len(products) + len(customers)
+                print(f"Streaming orders, order items and reviews in chunks of {chunk_size:,} orders...")
+                validation = SampledValidation(validation_sample_size) if validate == "sample" else None
+                generate_streaming(
+                    faker, products, customers, config, whale_ids, writer, chunk_size, pools, skew, validation, profiler
+                )
+            if validation is not None:
+                print("Running sampled data validations...")
+                with profiler.stage("validation"):
+                    validation.check(products, customers, skew)
+            finish()
+            return
+
+        print("Generating orders...")
+        with profiler.stage("orders") as stage:
+            orders = generate_orders(faker, customers, config, whale_ids, pools, skew=skew)
+            stage.rows += len(orders)
+
+        print("Generating order items...")
+        with profiler.stage("order_items") as stage:
+            order_items = generate_order_items(orders, products, config, whale_ids, skew=skew)
+            stage.rows += len(order_items)
+
+        print("Generating reviews...")
+        with profiler.stage("reviews") as stage:
+            reviews = generate_reviews(orders, order_items, products, config)
+            stage.rows += len(reviews)
+
+    if time_ordered_ids:
+        print("Assigning time-ordered order, order item and review ids...")
+        with profiler.stage("time_ordered_ids") as stage:
+            orders, order_items, reviews = assign_time_ordered_ids(orders, order_items, reviews)
+            stage.rows += len(orders) + len(order_items) + len(reviews)
+
+    frames = {
+        "products": products,
+        "customers": customers,
+        "orders": orders,
+        "order_items": order_items,
+        "reviews": reviews,
+    }
+    profiler.bytes_per_row = bytes_per_row(frames)
+    profiler.uncompacted_bytes_per_row = uncompacted_bytes_per_row(frames)
+    print(
+        "In-memory footprint (uncompacted -> compact dtypes): "
+        + ", ".join(
+            f"{name} {profiler.uncompacted_bytes_per_row[name]:,.0f} -> {size:,.0f} B/row"
+            for name, size in profiler.bytes_per_row.items()
+        )
+    )
+
+    if validate != "off":
+        print(f"Running data validations ({validate})...")
+        with profiler.stage("validation") as stage:
+            validate_datasets(
+                products, customers, orders, order_items, reviews, whale_ids, config, skew, validate, validation_sample_size
+            )
+            stage.rows += sum(len(frame) for frame in frames.values())
+
+    print(f"Exporting {output_format} files to {output_dir.resolve()} ...")
+    with profiler.stage("export") as stage:
+        with writer:
+            export_frames(writer, frames)
+        stage.rows += sum(len(frame) for frame in frames.values())
+
+    if change_log:
+        print(f"Writing change log to {(output_dir / CHANGE_LOG_NAME).resolve()} ...")
+        with profiler.stage("change_log") as stage:
+            event_count = write_change_log(output_dir / CHANGE_LOG_NAME, orders, order_items, reviews)
+            stage.rows += event_count
+        print(f"Wrote {event_count:,} change events")
+
+    finish(data_shape_summary(products, customers, orders, order_items))
 
 
 if __name__ == "__main__":
@@ -611,8 +2405,210 @@ if __name__ == "__main__":
         "--output-dir",
         type=Path,
         default=DEFAULT_OUTPUT_DIR,
-        help="Destination directory for generated CSV files.",
+        help="Destination directory for generated files.",
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=sorted(OUTPUT_COMPRESSIONS),
+        default="csv",
+        help=(
+            "Output format; parquet and arrow require pyarrow, sqlite loads straight into "
+            f"<output-dir>/{SQLITE_DATABASE_NAME} without intermediate files."
+        ),
+    )
+    parser.add_argument(
+        "--schema",
+        type=Path,
+        default=DEFAULT_SCHEMA_FILE,
+        help="Schema SQL used to create the database for --format sqlite.",
+    )
+    parser.add_argument(
+        "--compression",
+        default=None,
+        help=(
+            "Compression codec for the chosen format: csv supports gzip/zstd (default none, zstd requires "
+            "zstandard); parquet/arrow default to zstd."
+        ),
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="Codec compression level (e.g. gzip 1-9, zstd 1-22); defaults to the codec's own default.",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help="Maximum rows per Parquet row group / Arrow record batch.",
+    )
+    parser.add_argument(
+        "--faker-pool-size",
+        type=int,
+        default=0,
+        help=(
+            "Pre-generate this many Faker values per field and sample rows from the pools. "
+            "Smaller pools are faster but repeat names/addresses more often; 0 calls Faker per row."
+        ),
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=0,
+        help=(
+            "Stream orders, order items and reviews to disk in chunks of this many orders so memory "
+            "stays bounded; 0 builds every table in memory."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Split customers, orders, items and reviews into this many shards generated in parallel "
+            "processes, each with its own seed spawned from RANDOM_SEED. Output is reproducible per worker count."
+        ),
+    )
+    parser.add_argument(
+        "--scale-factor",
+        type=float,
+        default=1.0,
+        help="Scale every table linearly from the SF1 defaults (200/1000/3000/8000/2500 rows).",
+    )
+    for table in ("products", "customers", "orders", "order-items", "reviews"):
+        parser.add_argument(
+            f"--{table}",
+            type=int,
+            default=None,
+            help=f"Exact {table.replace('-', ' ')} row count, overriding the scale factor.",
+        )
+    parser.add_argument(
+        "--append-days",
+        type=int,
+        default=0,
+        help=(
+            "Instead of regenerating, continue the dataset already in --output-dir by this many days, "
+            f"writing each day's new rows to {DAILY_PARTITION_DIR}/<YYYY-MM-DD>/."
+        ),
+    )
+    parser.add_argument(
+        "--change-log",
+        action="store_true",
+        help=(
+            f"Also write {CHANGE_LOG_NAME}, a timestamped JSONL change log (order created, line items added, "
+            "status changed, review posted) for scripts/replay_changes.py."
+        ),
+    )
+    parser.add_argument(
+        "--skew-profile",
+        default="default",
+        help=(
+            f"Data-shape profile for stress datasets: {', '.join(SKEW_PROFILES)}. Parameterise with "
+            "zipf:S, hot-customer:CUSTOMER_SHARE[:ORDER_SHARE] or flash-sale:YYYY-MM-DD[,...][:MULTIPLIER] "
+            f"and combine with '+', e.g. zipf:1.3+hot-customer. The profile is recorded in {MANIFEST_NAME}."
+        ),
+    )
+    parser.add_argument(
+        "--time-ordered-ids",
+        action="store_true",
+        help=(
+            "Emit orders (with their items) sorted by order_date and reviews by review_date, with ids "
+            "assigned in that order, so date-range scans hit contiguous rowid ranges."
+        ),
+    )
+    parser.add_argument(
+        "--validate",
+        choices=VALIDATION_MODES,
+        default=None,
+        help=(
+            "full checks every row; sample checks rules and statistics on reservoir samples with "
+            "confidence bounds; off skips validation. Defaults to full, or sample with --chunk-size."
+        ),
+    )
+    parser.add_argument(
+        "--validation-sample-size",
+        type=int,
+        default=DEFAULT_VALIDATION_SAMPLE_SIZE,
+        help="Rows kept per reservoir sample for --validate sample.",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help=(
+            f"Also record each stage's tracemalloc peak in {RUN_REPORT_NAME}. Tracing slows Faker-heavy "
+            "stages several-fold, so compare traced timings only with other traced runs."
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Reuse outputs from this content-addressed cache when config, seed, skew, output options and "
+            "generator code all match, and store new outputs there."
+        ),
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_CACHE_MAX_MB,
+        help="Cache size limit; least recently used entries are evicted beyond it.",
     )
     args = parser.parse_args()
-    main(args.output_dir)
+    if args.cache_dir is not None and args.append_days > 0:
+        parser.error("--append-days continues the dataset on disk and cannot use --cache-dir")
+    if args.validate is None:
+        args.validate = "sample" if args.chunk_size > 0 else "full"
+    if args.validate == "full" and args.chunk_size > 0:
+        parser.error("--validate full needs the full in-memory dataset; use sample with --chunk-size")
+    if args.validation_sample_size < 1:
+        parser.error("--validation-sample-size must be at least 1")
+    if args.change_log and (args.chunk_size > 0 or args.append_days > 0):
+        parser.error("--change-log needs the full in-memory dataset; drop --chunk-size/--append-days")
+    if args.append_days > 0 and args.output_format == "sqlite":
+        parser.error("--append-days writes file partitions; use a file --format")
+    if args.time_ordered_ids and args.chunk_size > 0:
+        parser.error("--time-ordered-ids sorts the full dataset; drop --chunk-size (daily partitions are already time-ordered)")
+    if args.workers > 1 and args.chunk_size > 0:
+        parser.error("--workers and --chunk-size cannot be combined")
+    try:
+        config = GenerationConfig.scaled(
+            args.scale_factor,
+            products=args.products,
+            customers=args.customers,
+            orders=args.orders,
+            order_items=args.order_items,
+            reviews=args.reviews,
+        )
+        skew = parse_skew_profile(args.skew_profile)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.workers > config.customers:
+        parser.error(f"--workers {args.workers} exceeds the {config.customers:,} customers to shard; lower it")
+    if args.compression and args.compression not in OUTPUT_COMPRESSIONS[args.output_format]:
+        parser.error(f"--format {args.output_format} supports --compression {OUTPUT_COMPRESSIONS[args.output_format]}")
+    if args.compression_level is not None and (args.compression or OUTPUT_COMPRESSIONS[args.output_format][0]) == "none":
+        parser.error("--compression-level needs a compression codec; choose one with --compression")
+    main(
+        args.output_dir,
+        args.faker_pool_size,
+        args.chunk_size,
+        args.workers,
+        config,
+        args.output_format,
+        args.compression,
+        args.row_group_size,
+        args.compression_level,
+        args.schema,
+        args.append_days,
+        args.change_log,
+        skew,
+        args.time_ordered_ids,
+        args.validate,
+        args.validation_sample_size,
+        args.trace_memory,
+        args.cache_dir,
+        args.cache_max_mb * 2**20,
+    )
 
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Replay a generated change log against the e-commerce SQLite database.
+
+Events from changes.jsonl (written by `generate_data.py --change-log`) are applied in
+order at a controlled events/sec rate: orders are inserted, line items are inserted and
+rolled into the order total, statuses are updated and reviews are inserted. The script
+reports achieved throughput and per-event latency (from each event's scheduled time to
+its completion), so the update path can be measured under a known load.
+
+The target database must already hold products and customers, e.g. from
+`generate_data.py --format sqlite` or `setup_database.py`; pass --reset to clear the
+orders, order items and reviews that a full load would already contain.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+DEFAULT_DB_PATH = Path("database") / "ecommerce.db"
+DEFAULT_CHANGE_LOG = Path("data") / "synthetic" / "changes.jsonl"
+
+ORDER_COLUMNS = [
+    "order_id",
+    "customer_id",
+    "order_date",
+    "status",
+    "payment_method",
+    "shipping_address",
+    "shipping_city",
+    "shipping_state",
+    "shipping_zip",
+    "shipping_country",
+    "total_amount",
+]
+ORDER_ITEM_COLUMNS = ["order_item_id", "order_id", "product_id", "quantity", "unit_price", "discount", "line_total"]
+REVIEW_COLUMNS = ["review_id", "product_id", "customer_id", "rating", "review_text", "review_date"]
+
+
+def insert_sql(table: str, columns: List[str]) -> str:
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+
+
+def read_events(change_log: Path, limit: Optional[int] = None) -> Iterator[Dict]:
+    """Yield events from a JSONL change log, optionally stopping after `limit` events."""
+    if not change_log.exists():
+        raise FileNotFoundError(f"Change log not found: {change_log}")
+    with change_log.open("r", encoding="utf-8") as events:
+        for count, line in enumerate(events):
+            if limit is not None and count >= limit:
+                return
+            yield json.loads(line)
+
+
+def apply_event(connection: sqlite3.Connection, event: Dict) -> None:
+    """Apply one change event to the database (without committing)."""
+    event_type = event["event_type"]
+    if event_type == "order_created":
+        connection.execute(insert_sql("orders", ORDER_COLUMNS), [event[column] for column in ORDER_COLUMNS])
+    elif event_type == "line_item_added":
+        connection.execute(
+            insert_sql("order_items", ORDER_ITEM_COLUMNS),
+            [event[column] for column in ORDER_ITEM_COLUMNS],
+        )
+        connection.execute(
+            "UPDATE orders SET total_amount = total_amount + ? WHERE order_id = ?",
+            (event["line_total"], event["order_id"]),
+        )
+    elif event_type == "status_changed":
+        cursor = connection.execute(
+            "UPDATE orders SET status = ? WHERE order_id = ? AND status = ?",
+            (event["new_status"], event["order_id"], event["old_status"]),
+        )
+        if cursor.rowcount != 1:
+            raise ValueError(f"Order {event['order_id']} is not in status {event['old_status']!r} (event {event['event_id']})")
+    elif event_type == "review_posted":
+        connection.execute(insert_sql("reviews", REVIEW_COLUMNS), [event[column] for column in REVIEW_COLUMNS])
+    else:
+        raise ValueError(f"Unknown event type {event_type!r} (event {event['event_id']})")
+
+
+def reset_fact_tables(connection: sqlite3.Connection) -> None:
+    """Remove orders, order items and reviews (children first) so the log can recreate them."""
+    with connection:
+        for table in ("order_items", "reviews", "orders"):
+            connection.execute(f"DELETE FROM {table}")
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def replay(
+    db_path: Path,
+    change_log: Path,
+    rate: float,
+    commit_every: int = 1,
+    limit: Optional[int] = None,
+    reset: bool = False,
+) -> Dict:
+    """
+    Apply the change log at `rate` events/sec (0 = as fast as possible), committing every
+    `commit_every` events. Latency runs from an event's scheduled time to its completion,
+    so it includes queueing delay once the database falls behind the target rate.
+    """
+    connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA foreign_keys = ON")
+    if reset:
+        reset_fact_tables(connection)
+
+    latencies: List[float] = []
+    event_counts: Counter = Counter()
+    start = time.perf_counter()
+    try:
+        for index, event in enumerate(read_events(change_log, limit)):
+            scheduled = start + index / rate if rate > 0 else time.perf_counter()
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            apply_event(connection, event)
+            if (index + 1) % commit_every == 0:
+                connection.commit()
+            latencies.append(time.perf_counter() - scheduled)
+            event_counts[event["event_type"]] += 1
+        connection.commit()
+    finally:
+        connection.close()
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "events": len(latencies),
+        "event_counts": dict(event_counts),
+        "elapsed_seconds": elapsed,
+        "target_rate": rate,
+        "achieved_rate": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies, 0.50) * 1_000,
+            "p95": percentile(latencies, 0.95) * 1_000,
+            "p99": percentile(latencies, 0.99) * 1_000,
+            "max": (latencies[-1] if latencies else 0.0) * 1_000,
+        },
+    }
+
+
+def print_report(report: Dict) -> None:
+    print("\n" + "=" * 80)
+    print("CHANGE LOG REPLAY REPORT")
+    print("=" * 80)
+    target = f"{report['target_rate']:,.0f} events/sec" if report["target_rate"] > 0 else "unthrottled"
+    print(f"Events applied : {report['events']:,} in {report['elapsed_seconds']:.2f}s")
+    print(f"Target rate    : {target}")
+    print(f"Achieved rate  : {report['achieved_rate']:,.0f} events/sec")
+
+    print("\n--- EVENTS BY TYPE ---")
+    for event_type, count in sorted(report["event_counts"].items()):
+        print(f"  {event_type:20s}: {count:>10,}")
+
+    print("\n--- LATENCY (ms) ---")
+    for name, value in report["latency_ms"].items():
+        print(f"  {name:20s}: {value:>10.3f}")
+    print("=" * 80)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a generated change log against the SQLite database.")
+    parser.add_argument("--db-path", type=Path, default=DEFAULT_DB_PATH, help="Path to SQLite database file.")
+    parser.add_argument("--change-log", type=Path, default=DEFAULT_CHANGE_LOG, help="Path to changes.jsonl.")
+    parser.add_argument("--rate", type=float, default=1_000.0, help="Target events per second (0 = unthrottled).")
+    parser.add_argument("--commit-every", type=int, default=1, help="Commit after this many events.")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many events.")
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Delete existing orders, order items and reviews before replaying.",
+    )
+    parser.add_argument("--report", type=Path, default=None, help="Optional path to write the report as JSON.")
+    args = parser.parse_args()
+    if args.commit_every < 1:
+        parser.error("--commit-every must be at least 1")
+
+    report = replay(args.db_path, args.change_log, args.rate, args.commit_every, args.limit, args.reset)
+    print_report(report)
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Replay report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
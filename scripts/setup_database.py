@@ -31,6 +31,8 @@ import pandas as pd
 DEFAULT_DB_PATH = Path("database") / "ecommerce.db"
 DEFAULT_CSV_DIR = Path("data") / "synthetic"
 DEFAULT_SCHEMA = Path("database") / "schema.sql"
+# Compressed CSV variants written by the generator; pandas infers the codec from the suffix
+COMPRESSED_CSV_SUFFIXES = (".gz", ".zst")
 LOG_DIR = Path("database")
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -169,10 +171,17 @@ class DatabaseSetup:
         return len(errors) == 0
 
     # ----------------------------- CSV loading -------------------------------
+    def resolve_csv_path(self, csv_file: Path) -> Path:
+        """Return the CSV path, falling back to a gzip/zstd-compressed sibling (e.g. orders.csv.gz)."""
+        candidates = [csv_file] + [csv_file.with_name(csv_file.name + suffix) for suffix in COMPRESSED_CSV_SUFFIXES]
+        for candidate in candidates:
+            if candidate.exists():
+                return candidate
+        raise FileNotFoundError(f"CSV file not found: {csv_file}")
+
     def load_csv(self, csv_file: Path, table_name: str, required_columns: List[str]) -> pd.DataFrame:
-        """Load CSV and run lightweight validation and normalization."""
-        if not csv_file.exists():
-            raise FileNotFoundError(f"CSV file not found: {csv_file}")
+        """Load CSV (optionally .gz/.zst compressed) and run lightweight validation and normalization."""
+        csv_file = self.resolve_csv_path(csv_file)
 
         logger.info(f"Loading {csv_file} for table {table_name}...")
         df = pd.read_csv(csv_file)
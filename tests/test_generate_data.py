@@ -0,0 +1,54 @@
+"""Regression checks for scripts/generate_data.py."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+from faker import Faker
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "generate_data.py"
+spec = importlib.util.spec_from_file_location("generate_data", SCRIPT)
+generate_data = importlib.util.module_from_spec(spec)
+sys.modules["generate_data"] = generate_data
+spec.loader.exec_module(generate_data)
+
+
+def test_product_margins_stay_in_band_at_large_scale():
+    faker = Faker()
+    pools = generate_data.build_faker_pools(faker, 100)
+    for scale_factor in (300, 1_000):
+        generate_data.set_random_seed()
+        products = generate_data.generate_products(faker, generate_data.GenerationConfig.scaled(scale_factor), pools)
+        margins = (products["price"] - products["cost"]) / products["price"]
+        assert margins.between(0.20, 0.50).all(), f"margin out of band at SF{scale_factor}"
+
+
+def test_tiny_scale_factors_skip_revenue_shape_checks():
+    faker = Faker()
+    for scale_factor in (0.01, 0.001):
+        generate_data.set_random_seed()
+        config = generate_data.GenerationConfig.scaled(scale_factor)
+        products = generate_data.generate_products(faker, config)
+        customers = generate_data.generate_customers(faker, config)
+        whale_ids = generate_data.select_whale_ids(customers)
+        orders = generate_data.generate_orders(faker, customers, config, whale_ids)
+        order_items = generate_data.generate_order_items(orders, products, config, whale_ids)
+        reviews = generate_data.generate_reviews(orders, order_items, products, config)
+        generate_data.validate_datasets(products, customers, orders, order_items, reviews, whale_ids, config)
+
+
+def test_append_resumes_after_trailing_day_without_orders(tmp_path):
+    generate_data.main(tmp_path, validate="off")
+    generate_data.main(tmp_path, append_days=3)
+    # Empty the last day's fact tables so it is a quiet day that only registered customers
+    last_day = generate_data.daily_partition_dirs(tmp_path)[-1]
+    for name in ("orders", "order_items", "reviews"):
+        path = last_day / f"{name}.csv"
+        path.write_text(path.read_text().splitlines()[0] + "\n")
+    quiet_day_customers = set(generate_data.read_generated_table(last_day, "customers")["customer_id"])
+
+    generate_data.main(tmp_path, append_days=2)
+
+    days = [path.name for path in generate_data.daily_partition_dirs(tmp_path)]
+    assert len(days) == 5 and days[2] == last_day.name
+    assert set(generate_data.read_generated_table(last_day, "customers")["customer_id"]) == quiet_day_customers